@@ -10,13 +10,22 @@ documented in README.md and AGENT_GUIDE.md.
 """
 
 import ast
+import os
 import re
 import json
 from pathlib import Path
-from typing import List, Dict, Set, Tuple, Optional
+from typing import List, Dict, Set, FrozenSet, Tuple, Optional
 from dataclasses import dataclass, asdict
 import argparse
 
+# Patterns used by DocChecker, compiled once at import
+# add_argument("--flag" ...) definitions in harness.py
+_CLI_FLAG_RE = re.compile(r'add_argument\(["\'](--?[\w-]+)["\']')
+# `--flag` mentions in README.md
+_DOC_FLAG_RE = re.compile(r'`(--?[\w-]+)`')
+# **`filename.py`** or `filename.py` entries in AGENT_GUIDE.md
+_DOC_FILE_RE = re.compile(r'\*?\*?`([\w]+\.py)`\*?\*?')
+
 
 @dataclass
 class DocDrift:
@@ -39,11 +48,32 @@ class DocDecision:
 class DocChecker:
     """Detects and tracks documentation drift."""
 
-    def __init__(self, project_dir: Path, readme_path: Path = None, agent_guide_path: Path = None):
+    def __init__(self, project_dir: Path, readme_path: Path = None, agent_guide_path: Path = None,
+                 files: Optional[Dict[str, str]] = None):
         self.project_dir = Path(project_dir)
+        # Project-relative path -> content, used instead of reading those files from disk
+        self._files = files or {}
         self.readme_path = readme_path or (self.project_dir / "README.md")
         self.agent_guide_path = agent_guide_path or (self.project_dir / "AGENT_GUIDE.md")
         self.drift_items: List[DocDrift] = []
+        # directory -> (directory mtime, public .py file names)
+        self._scan_cache: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+
+    def _relative_name(self, path: Path) -> Optional[str]:
+        """Return path relative to the project as a posix string, or None if outside it."""
+        try:
+            return path.relative_to(self.project_dir).as_posix()
+        except ValueError:
+            return None
+
+    def _exists(self, path: Path) -> bool:
+        """Check whether a project file exists, honouring supplied contents."""
+        return self._relative_name(path) in self._files or path.exists()
+
+    def _read_text(self, path: Path) -> str:
+        """Read a project file, preferring supplied contents over disk."""
+        content = self._files.get(self._relative_name(path))
+        return content if content is not None else path.read_text()
 
     def detect_cli_flag_drift(self, harness_file: Path = None) -> List[DocDrift]:
         """
@@ -53,7 +83,7 @@ class DocChecker:
             List of DocDrift items for undocumented CLI flags
         """
         harness_file = harness_file or (self.project_dir / "harness.py")
-        if not harness_file.exists():
+        if not self._exists(harness_file):
             return []
 
         # Parse harness.py to extract CLI argument definitions
@@ -87,7 +117,7 @@ class DocChecker:
             List of DocDrift items for undocumented public files
         """
         agent_guide_file = agent_guide_file or self.agent_guide_path
-        if not agent_guide_file.exists():
+        if not self._exists(agent_guide_file):
             return []
 
         # Get all public .py files in project root
@@ -134,17 +164,10 @@ class DocChecker:
         flags = set()
 
         try:
-            content = harness_file.read_text()
-
-            # Find all add_argument calls
-            pattern = r'add_argument\(["\']--?[\w-]+["\']'
-            matches = re.findall(pattern, content)
+            content = self._read_text(harness_file)
 
-            for match in matches:
-                # Extract the flag name
-                flag_match = re.search(r'["\'](--?[\w-]+)["\']', match)
-                if flag_match:
-                    flags.add(flag_match.group(1))
+            # Find all add_argument calls and capture the flag name
+            flags.update(_CLI_FLAG_RE.findall(content))
 
         except Exception as e:
             print(f"Warning: Could not parse {harness_file}: {e}")
@@ -156,45 +179,56 @@ class DocChecker:
         flags = set()
 
         try:
-            content = readme_file.read_text()
+            content = self._read_text(readme_file)
 
             # Find code blocks with CLI examples
-            pattern = r'`(--?[\w-]+)`'
-            matches = re.findall(pattern, content)
-
-            for match in matches:
-                flags.add(match)
+            flags.update(_DOC_FLAG_RE.findall(content))
 
         except Exception as e:
             print(f"Warning: Could not read {readme_file}: {e}")
 
         return flags
 
-    def _get_public_python_files(self, project_dir: Path) -> Set[str]:
-        """Get all public .py files in project root (excluding test_, __)."""
+    def _get_public_python_files(self, project_dir: Path) -> FrozenSet[str]:
+        """Get all public .py files in project root (excluding test_, __).
+
+        Results are cached per directory and reused while its mtime is unchanged
+        (adding, removing or renaming an entry bumps the directory mtime).
+        """
+        try:
+            mtime = project_dir.stat().st_mtime_ns
+        except OSError:
+            return frozenset()
+
+        key = str(project_dir)
+        cached = self._scan_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
         files = set()
 
-        for py_file in project_dir.glob("*.py"):
-            # Skip test files and private files
-            if not py_file.name.startswith('_') and not py_file.name.startswith('test_'):
-                files.add(py_file.name)
+        # scandir yields names without a stat or Path object per entry
+        with os.scandir(project_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                # Skip hidden (as glob does), test and private files
+                if name.endswith('.py') and not name.startswith(('.', '_', 'test_')):
+                    files.add(name)
 
-        return files
+        result = frozenset(files)
+        self._scan_cache[key] = (mtime, result)
+        return result
 
     def _extract_documented_files(self, agent_guide_file: Path) -> Set[str]:
         """Extract documented files from AGENT_GUIDE.md Repository Map."""
         files = set()
 
         try:
-            content = agent_guide_file.read_text()
+            content = self._read_text(agent_guide_file)
 
             # Find references to .py files in the repository map section
             # Look for patterns like: **`filename.py`** or `filename.py`
-            pattern = r'\*?\*?`([\w]+\.py)`\*?\*?'
-            matches = re.findall(pattern, content)
-
-            for match in matches:
-                files.add(match)
+            files.update(_DOC_FILE_RE.findall(content))
 
         except Exception as e:
             print(f"Warning: Could not read {agent_guide_file}: {e}")
@@ -205,11 +239,16 @@ class DocChecker:
 class DocDecisionStore:
     """Manages persistence of documentation decisions."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, persist: bool = True):
         self.project_dir = Path(project_dir)
         self.decisions_dir = self.project_dir / ".harness"
         self.decisions_file = self.decisions_dir / "doc_decisions.json"
         self.decisions: Dict[str, DocDecision] = {}
+        # persist=False keeps decisions in memory only and never touches disk
+        self.persist = persist
+
+        if not persist:
+            return
 
         # Create .harness directory if it doesn't exist
         self.decisions_dir.mkdir(exist_ok=True)
@@ -229,6 +268,8 @@ class DocDecisionStore:
 
     def save(self):
         """Save decisions to storage."""
+        if not self.persist:
+            return
         try:
             data = {
                 item_id: asdict(decision)
@@ -316,17 +357,21 @@ class DocDecisionStore:
         return f"{drift.type}:{drift.item}"
 
 
-def check_drift_before_finish(project_dir: Path) -> Tuple[bool, List[DocDrift], DocDecisionStore]:
+def check_drift_before_finish(
+    project_dir: Path, *, files: Optional[Dict[str, str]] = None
+) -> Tuple[bool, List[DocDrift], DocDecisionStore]:
     """
     Main entry point for documentation drift detection in finish command.
 
     Args:
         project_dir: Path to the project directory
+        files: Optional already-loaded contents keyed by project-relative path
+            (e.g. "README.md"); these are used instead of reading from disk
 
     Returns:
         Tuple of (has_drift, drift_items, decision_store)
     """
-    checker = DocChecker(project_dir)
+    checker = DocChecker(project_dir, files=files)
     store = DocDecisionStore(project_dir)
 
     # Detect all drift
@@ -6,7 +6,10 @@ Append-only event logging system for audit trail and debugging.
 """
 
 import json
+import os
 import uuid
+import weakref
+from collections import deque
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Optional, Any, Union, Dict
@@ -14,6 +17,14 @@ from datetime import datetime
 from enum import Enum
 import logging
 
+# Optional fast JSON backend for the event log
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Event log file path
@@ -60,6 +71,8 @@ class Event:
 
     def to_json_line(self) -> str:
         """Convert to JSON line for logging."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(asdict(self), option=orjson.OPT_NON_STR_KEYS).decode()
         return json.dumps(asdict(self))
 
 
@@ -75,6 +88,33 @@ class EventLogger:
         """
         self.log_path = log_path
         self.sessionId = session_id or str(uuid.uuid4())
+        # Line-buffered append handle, opened on first event and kept until
+        # close(); the finalizer closes it if the logger is collected or the
+        # interpreter exits first, without keeping the logger alive
+        self._fh = None
+        self._finalizer = None
+
+    def __enter__(self) -> "EventLogger":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the log file handle (reopened automatically on the next event)."""
+        if self._fh is not None:
+            self._finalizer()
+            self._fh = None
+            self._finalizer = None
+
+    def _log_replaced(self) -> bool:
+        """Check whether log_path no longer names the open file (rotated or deleted)."""
+        try:
+            current = os.stat(self.log_path)
+        except FileNotFoundError:
+            return True
+        opened = os.fstat(self._fh.fileno())
+        return (current.st_ino, current.st_dev) != (opened.st_ino, opened.st_dev)
 
     def ensure_directories(self) -> None:
         """Ensure log directory exists."""
@@ -89,8 +129,6 @@ class EventLogger:
             event_type: Type of event (EventType enum or string)
             data: Additional event data
         """
-        self.ensure_directories()
-
         # Convert enum to string if needed
         if isinstance(event_type, EventType):
             event_type = event_type.value
@@ -102,10 +140,16 @@ class EventLogger:
             data=data,
         )
 
-        # Append to log file
-        with open(self.log_path, "a") as f:
-            f.write(event.to_json_line())
-            f.write("\n")
+        # Append to log file; line buffering flushes each event for readers
+        if self._fh is not None and self._log_replaced():
+            self.close()
+        if self._fh is None:
+            self.ensure_directories()
+            # UTF-8 explicitly: orjson emits non-ASCII text as-is, which the
+            # locale default encoding may not be able to represent
+            self._fh = open(self.log_path, "a", buffering=1, encoding="utf-8")
+            self._finalizer = weakref.finalize(self, self._fh.close)
+        self._fh.write(event.to_json_line() + "\n")
 
         logger.debug(f"Logged event: {event_type}")
 
@@ -222,27 +266,24 @@ def read_events(
     if not log_path.exists():
         return []
 
-    events = []
+    # With a limit, keep only the most recent events while streaming the file
+    events = deque(maxlen=limit) if limit and limit > 0 else []
 
     try:
-        with open(log_path, "r") as f:
+        with open(log_path, "r", encoding="utf-8") as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
 
                 try:
-                    data = json.loads(line)
+                    data = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
                     event = Event(**data)
                     events.append(event)
                 except (json.JSONDecodeError, TypeError) as e:
                     logger.warning(f"Skipping malformed event log line: {e}")
 
-        # If limit specified, return most recent events
-        if limit and len(events) > limit:
-            events = events[-limit:]
-
-        return events
+        return list(events)
 
     except Exception as e:
         logger.error(f"Error reading event log: {e}")
@@ -1286,7 +1286,8 @@ def handle_session(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
-def main() -> None:
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
     parser = argparse.ArgumentParser(
         description="Autonomous Coding Agent CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -1393,7 +1394,17 @@ def main() -> None:
                                  help="Apply updates explicitly (no auto-update)")
     bootstrap_parser.set_defaults(func=handle_bootstrap, apply=False)
 
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """CLI entry point.
+
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
     
     # Execute the handler
     if hasattr(args, "func"):
@@ -30,6 +30,20 @@ HEARTBEAT_FILE = LOCKS_DIR / "commander.heartbeat"
 HEARTBEAT_TIMEOUT = timedelta(minutes=5)
 
 
+def _now() -> datetime:
+    """Current naive UTC time; a single seam so tests can freeze the clock."""
+    return datetime.utcnow()
+
+
+def _pid_is_alive(pid: int) -> bool:
+    """Check whether a process exists; the single liveness check for locks."""
+    try:
+        os.kill(pid, 0)  # Signal 0 just checks if process exists
+        return True
+    except (OSError, ProcessLookupError):
+        return False
+
+
 @dataclass
 class LockInfo:
     """Information stored in lock file."""
@@ -106,11 +120,7 @@ class LockManager:
         Returns:
             True if PID is alive, False otherwise
         """
-        try:
-            os.kill(pid, 0)  # Signal 0 just checks if process exists
-            return True
-        except (OSError, ProcessLookupError):
-            return False
+        return _pid_is_alive(pid)
 
     def read_lock_info(self) -> Optional[LockInfo]:
         """Read current lock file.
@@ -157,7 +167,7 @@ class LockManager:
         """
         try:
             last_beat = datetime.fromisoformat(heartbeat.lastBeatAt.replace("Z", "+00:00"))
-            now = datetime.utcnow().replace(tzinfo=last_beat.tzinfo)
+            now = _now().replace(tzinfo=last_beat.tzinfo)
             age = now - last_beat
             return age > HEARTBEAT_TIMEOUT
         except (ValueError, TypeError) as e:
@@ -279,7 +289,7 @@ class LockManager:
         """Actually acquire the lock (internal method)."""
         lock_info = LockInfo(
             pid=os.getpid(),
-            startTime=datetime.utcnow().isoformat() + "Z",
+            startTime=_now().isoformat() + "Z",
             sessionId=self.sessionId,
         )
         self.write_lock(lock_info)
@@ -287,7 +297,7 @@ class LockManager:
         # Write initial heartbeat
         heartbeat_info = HeartbeatInfo(
             sessionId=self.sessionId,
-            lastBeatAt=datetime.utcnow().isoformat() + "Z",
+            lastBeatAt=_now().isoformat() + "Z",
         )
         self.write_heartbeat(heartbeat_info)
 
@@ -306,7 +316,7 @@ class LockManager:
 
         heartbeat_info = HeartbeatInfo(
             sessionId=self.sessionId,
-            lastBeatAt=datetime.utcnow().isoformat() + "Z",
+            lastBeatAt=_now().isoformat() + "Z",
         )
         self.write_heartbeat(heartbeat_info)
         logger.debug("Heartbeat updated")
@@ -7,11 +7,14 @@ Prevents "split brain" state by always adopting Git as source of truth.
 """
 
 import os
+import re
+import json
 import subprocess
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, List, Callable
-from datetime import datetime, timedelta
+from typing import Optional, Dict, List, Callable, Union
+from datetime import timedelta
 from functools import wraps
 import logging
 
@@ -20,6 +23,16 @@ logger = logging.getLogger(__name__)
 # Reconciliation result cache duration (30 seconds)
 RECONCILE_CACHE_DURATION = timedelta(seconds=30)
 
+# One match per record in `git worktree list --porcelain` output. Trailing
+# attribute lines (locked, prunable) are skipped by anchoring on "worktree".
+_WORKTREE_RE = re.compile(
+    rb"^worktree (?P<path>[^\n]*)\n"
+    rb"(?:HEAD [^\n]*\n)?"
+    rb"(?:branch (?:refs/heads/)?(?P<branch>[^\n]*)\n|detached\n)?"
+    rb"(?P<bare>bare$)?",
+    re.M,
+)
+
 
 @dataclass
 class GitStatus:
@@ -63,37 +76,40 @@ class ReconcileResult:
 
 
 def cached(cache_duration: timedelta = RECONCILE_CACHE_DURATION):
-    """Decorator for caching reconciliation results.
+    """Decorator for caching reconciliation results per instance.
+
+    Results live on the instance itself, keyed by call arguments, with an
+    expiry on the monotonic clock so wall-clock jumps cannot extend them.
 
     Args:
         cache_duration: How long to cache results
     """
+    duration_ns = int(cache_duration.total_seconds() * 1_000_000_000)
 
     def decorator(func: Callable) -> Callable:
-        cache = {}
-        last_call = {}
+        attr = f"_cache_{func.__name__}"
 
         @wraps(func)
         def wrapper(self, *args, **kwargs):
             # Create cache key from args
-            cache_key = (func.__name__, args, frozenset(kwargs.items()))
+            cache_key = (args, frozenset(kwargs.items()))
+            cache = self.__dict__.setdefault(attr, {})
 
             # Check if cache is still valid
-            if cache_key in cache:
-                last_time = last_call[cache_key]
-                if datetime.utcnow() - last_time < cache_duration:
-                    logger.debug(f"Cache hit for {func.__name__}")
-                    return cache[cache_key]
+            now = time.monotonic_ns()
+            entry = cache.get(cache_key)
+            if entry is not None and entry[0] > now:
+                logger.debug(f"Cache hit for {func.__name__}")
+                return entry[1]
 
             # Call function and cache result
             result = func(self, *args, **kwargs)
-            cache[cache_key] = result
-            last_call[cache_key] = datetime.utcnow()
+            cache[cache_key] = (time.monotonic_ns() + duration_ns, result)
 
             return result
 
-        # Add method to clear cache
-        wrapper.clear_cache = lambda: cache.clear()
+        # Add method to clear an instance's cache
+        wrapper.clear_cache = lambda instance: instance.__dict__.pop(attr, None)
 
         return wrapper
 
@@ -103,21 +119,27 @@ def cached(cache_duration: timedelta = RECONCILE_CACHE_DURATION):
 class Reconciler:
     """Reconciliation engine for syncing state with Git reality."""
 
-    def __init__(self, harness_path: Optional[Path] = None):
+    def __init__(self, harness_path: Optional[Path] = None, runs_dir: Optional[Path] = None):
         """Initialize reconciler.
 
         Args:
             harness_path: Path to harness root (defaults to current dir)
+            runs_dir: Directory holding harness runs (defaults to harness_path / "runs")
         """
         self.harness_path = harness_path or Path.cwd()
-        self.runs_dir = self.harness_path / "runs"
+        self.runs_dir = runs_dir or self.harness_path / "runs"
+        # Parsed .run metadata keyed by file path -> (st_mtime_ns, st_size, info)
+        self._meta_cache: Dict[str, tuple[int, int, HarnessRunInfo]] = {}
 
-    def run_git(self, args: List[str], cwd: Optional[Path] = None) -> str:
+    def run_git(
+        self, args: List[str], cwd: Optional[Path] = None, text: bool = True
+    ) -> Union[str, bytes]:
         """Run a git command and return output.
 
         Args:
             args: Git command arguments (without 'git')
             cwd: Working directory (defaults to harness_path)
+            text: If False, return raw stdout bytes (not stripped)
 
         Returns:
             Command stdout
@@ -127,17 +149,22 @@ class Reconciler:
         """
         cwd = cwd or self.harness_path
 
+        # Capture raw bytes and decode once, skipping the TextIOWrapper layer
         try:
             result = subprocess.run(
-                ["git"] + args,
+                ["git", *args],
                 cwd=cwd,
                 check=True,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
             )
-            return result.stdout.strip()
         except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Git command failed: git {' '.join(args)}\n{e.stderr}")
+            stderr = e.stderr.decode("utf-8", "replace")
+            raise RuntimeError(f"Git command failed: git {' '.join(args)}\n{stderr}")
+
+        if not text:
+            return result.stdout
+        return result.stdout.decode("utf-8", "replace").strip()
 
     def get_git_status(self, repo_path: Path) -> GitStatus:
         """Get git status for a repository.
@@ -152,12 +179,12 @@ class Reconciler:
             # Get current branch
             branch = self.run_git(["rev-parse", "--abbrev-ref", "HEAD"], cwd=repo_path)
 
-            # Check if working tree is clean
-            output = self.run_git(["status", "--porcelain"], cwd=repo_path)
-            clean = len(output.strip()) == 0
-
-            # Count changed files
-            files_changed = len(output.strip().split("\n")) if output.strip() else 0
+            # Porcelain v2 prints one newline-terminated record per changed path
+            # (renames included, unusual paths quoted), so counting newlines in
+            # the raw bytes gives the file count without decoding or splitting.
+            output = self.run_git(["status", "--porcelain=v2"], cwd=repo_path, text=False)
+            files_changed = output.count(b"\n")
+            clean = files_changed == 0
 
             return GitStatus(branch=branch, clean=clean, files_changed=files_changed)
 
@@ -177,34 +204,18 @@ class Reconciler:
         repo_path = repo_path or self.harness_path
 
         try:
-            output = self.run_git(["worktree", "list", "--porcelain"], cwd=repo_path)
-
-            worktrees = []
-            current_worktree = {}
-
-            for line in output.split("\n"):
-                if not line:
-                    if current_worktree:
-                        worktrees.append(
-                            WorktreeInfo(
-                                path=current_worktree.get("worktree", ""),
-                                branch=current_worktree.get("branch", "").replace(
-                                    "refs/heads/", ""
-                                ),
-                                is_bare=current_worktree.get("bare") == "true",
-                            )
-                        )
-                        current_worktree = {}
-                    continue
-
-                if line.startswith("worktree "):
-                    current_worktree["worktree"] = line[len("worktree ") :]
-                elif line.startswith("branch "):
-                    current_worktree["branch"] = line[len("branch ") :]
-                elif line == "bare":
-                    current_worktree["bare"] = "true"
+            output = self.run_git(
+                ["worktree", "list", "--porcelain"], cwd=repo_path, text=False
+            )
 
-            return worktrees
+            return [
+                WorktreeInfo(
+                    path=m["path"].decode("utf-8", "replace"),
+                    branch=(m["branch"] or b"").decode("utf-8", "replace"),
+                    is_bare=m["bare"] is not None,
+                )
+                for m in _WORKTREE_RE.finditer(output)
+            ]
 
         except Exception as e:
             logger.error(f"Error listing worktrees: {e}")
@@ -213,39 +224,55 @@ class Reconciler:
     def list_harness_runs(self) -> List[HarnessRunInfo]:
         """List all harness runs by parsing runs/ directory.
 
+        Metadata files whose mtime and size are unchanged since the last
+        call are served from cache instead of being re-read.
+
         Returns:
             List of HarnessRunInfo objects
         """
         if not self.runs_dir.exists():
+            self._meta_cache.clear()
             return []
 
         runs = []
+        seen = set()
 
-        for run_path in self.runs_dir.iterdir():
-            if not run_path.is_dir():
-                continue
+        with os.scandir(self.runs_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
 
-            # Check for .run metadata file
-            metadata_file = run_path / ".run"
-            if not metadata_file.exists():
-                continue
+                # Check for .run metadata file
+                metadata_path = os.path.join(entry.path, ".run")
+                try:
+                    st = os.stat(metadata_path)
+                except OSError:
+                    continue
 
-            try:
-                import json
+                seen.add(metadata_path)
+                cached = self._meta_cache.get(metadata_path)
+                if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    runs.append(cached[2])
+                    continue
 
-                with open(metadata_file, "r") as f:
-                    metadata = json.load(f)
+                try:
+                    with open(metadata_path, "r") as f:
+                        metadata = json.load(f)
 
-                runs.append(
-                    HarnessRunInfo(
-                        name=run_path.name,
+                    info = HarnessRunInfo(
+                        name=entry.name,
                         branch=metadata.get("branch", ""),
                         status=metadata.get("status", "unknown"),
-                        worktree_path=str(run_path),
+                        worktree_path=str(self.runs_dir / entry.name),
                     )
-                )
-            except Exception as e:
-                logger.warning(f"Error reading metadata for {run_path.name}: {e}")
+                    self._meta_cache[metadata_path] = (st.st_mtime_ns, st.st_size, info)
+                    runs.append(info)
+                except Exception as e:
+                    logger.warning(f"Error reading metadata for {entry.name}: {e}")
+
+        # Evict entries for runs that no longer exist
+        for stale in self._meta_cache.keys() - seen:
+            del self._meta_cache[stale]
 
         return runs
 
@@ -309,6 +336,55 @@ class Reconciler:
 
         return True, "Path is safe"
 
+    def reconcile_state(
+        self,
+        state,
+        harness_runs: Optional[List[HarnessRunInfo]] = None,
+    ) -> ReconcileResult:
+        """Sync an in-memory State with harness runs, without any disk I/O.
+
+        Runs in state but missing from the harness are parked (state set to
+        "missing") in place; the caller decides whether to save.
+
+        Args:
+            state: State object to update
+            harness_runs: Current harness runs (defaults to list_harness_runs())
+
+        Returns:
+            ReconcileResult with changes
+        """
+        result = ReconcileResult()
+
+        # Get current runs from harness
+        if harness_runs is None:
+            harness_runs = self.list_harness_runs()
+        harness_run_names = {r.name for r in harness_runs}
+
+        # Detect runs in state but missing from reality
+        runs_to_park = []
+        for run in state.runs:
+            if run.runName not in harness_run_names:
+                runs_to_park.append(run)
+                result.runs_parked += 1
+
+        # Park missing runs
+        for run in runs_to_park:
+            logger.warning(f"Run {run.runName} missing from filesystem, parking")
+            # Park by setting state to "missing"
+            run.state = "missing"
+            result.drift_detected = True
+
+        # Detect runs in reality but missing from state
+        existing_run_names = {r.runName for r in state.runs}
+        for harness_run in harness_runs:
+            if harness_run.name not in existing_run_names:
+                logger.info(f"Discovered run {harness_run.name} in filesystem")
+                # Would add to state here (implementation depends on schema)
+                result.runs_added += 1
+                result.drift_detected = True
+
+        return result
+
     @cached(cache_duration=RECONCILE_CACHE_DURATION)
     def reconcile(
         self,
@@ -327,38 +403,10 @@ class Reconciler:
         if event_logger:
             event_logger.log_reconcile_start()
 
-        result = ReconcileResult()
-
         try:
-            # Load current state
+            # Load current state and sync it in memory
             state = state_manager.load_state()
-
-            # Get current runs from harness
-            harness_runs = self.list_harness_runs()
-            harness_run_names = {r.name for r in harness_runs}
-
-            # Detect runs in state but missing from reality
-            runs_to_park = []
-            for run in state.runs:
-                if run.runName not in harness_run_names:
-                    runs_to_park.append(run)
-                    result.runs_parked += 1
-
-            # Park missing runs
-            for run in runs_to_park:
-                logger.warning(f"Run {run.runName} missing from filesystem, parking")
-                # Park by setting state to "missing"
-                run.state = "missing"
-                result.drift_detected = True
-
-            # Detect runs in reality but missing from state
-            existing_run_names = {r.runName for r in state.runs}
-            for harness_run in harness_runs:
-                if harness_run.name not in existing_run_names:
-                    logger.info(f"Discovered run {harness_run.name} in filesystem")
-                    # Would add to state here (implementation depends on schema)
-                    result.runs_added += 1
-                    result.drift_detected = True
+            result = self.reconcile_state(state)
 
             # Save updated state
             if result.drift_detected:
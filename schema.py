@@ -6,11 +6,23 @@ Canonical schema for handoff.json files.
 This is the single source of truth for the task format.
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import Optional
 import json
 from pathlib import Path
 
+# Optional streaming parser for large handoff files
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    ijson = None
+
+# Files smaller than this are parsed with json.load (ijson startup dominates)
+STREAM_THRESHOLD_BYTES = 1024 * 1024
+
 
 # Valid categories for tasks
 VALID_CATEGORIES = {
@@ -99,24 +111,35 @@ class Handoff:
     meta: HandoffMeta
     tasks: list[Task]
     
-    def validate(self) -> list[str]:
-        """Validate entire handoff and return list of errors."""
+    def validate(self, fail_fast: bool = False) -> list[str]:
+        """Validate entire handoff and return list of errors.
+        
+        Args:
+            fail_fast: Return as soon as any error is found instead of
+                validating every task
+        """
         errors = []
         errors.extend(self.meta.validate())
+        if fail_fast and errors:
+            return errors
         
         if not self.tasks:
             errors.append("Handoff has no tasks")
             return errors
         
         # Check for duplicate IDs
-        ids = [t.id for t in self.tasks]
-        duplicates = [id for id in ids if ids.count(id) > 1]
+        id_counts = Counter(t.id for t in self.tasks)
+        duplicates = {id for id, count in id_counts.items() if count > 1}
         if duplicates:
-            errors.append(f"Duplicate task IDs: {set(duplicates)}")
+            errors.append(f"Duplicate task IDs: {duplicates}")
+            if fail_fast:
+                return errors
         
         # Validate each task
         for task in self.tasks:
             errors.extend(task.validate())
+            if fail_fast and errors:
+                return errors
             
         return errors
     
@@ -150,6 +173,60 @@ class Handoff:
         }
 
 
+def _parse_legacy_task(item: dict, index: int) -> Task:
+    """Build a Task from a legacy-format (array of tasks) entry."""
+    return Task(
+        id=item.get("id", f"TASK-{index+1:03d}"),
+        category=item.get("category", "functional"),
+        title=item.get("title", item.get("description", "")[:50]),
+        description=item.get("description", ""),
+        acceptance_criteria=item.get("acceptance_criteria", item.get("steps", [])),
+        passes=item.get("passes", False),
+        files_expected=item.get("files_expected", []),
+        steps=item.get("steps", []),
+    )
+
+
+# Fields accepted from a task entry; unknown keys are ignored
+_TASK_FIELDS = frozenset({
+    "id",
+    "category",
+    "title",
+    "description",
+    "acceptance_criteria",
+    "passes",
+    "files_expected",
+    "steps",
+})
+
+
+def _parse_task(item: dict) -> Task:
+    """Build a Task from a new-format task entry.
+    
+    Only required fields get explicit defaults; passes/files_expected/steps
+    fall back to the dataclass defaults when absent.
+    """
+    kwargs = {
+        "id": "",
+        "category": "functional",
+        "title": "",
+        "description": "",
+        "acceptance_criteria": [],
+    }
+    kwargs.update({k: item[k] for k in item.keys() & _TASK_FIELDS})
+    return Task(**kwargs)
+
+
+def _parse_meta(meta_data: dict) -> HandoffMeta:
+    """Build HandoffMeta from the 'meta' section."""
+    return HandoffMeta(
+        project=meta_data.get("project", "Unknown"),
+        phase=meta_data.get("phase", "Phase 1"),
+        source=meta_data.get("source", ""),
+        lock=meta_data.get("lock", True),
+    )
+
+
 def parse_handoff(data: dict) -> Handoff:
     """Parse a dictionary into a Handoff object.
     
@@ -157,53 +234,98 @@ def parse_handoff(data: dict) -> Handoff:
     """
     # Handle legacy format: just an array of tasks
     if isinstance(data, list):
-        tasks = []
-        for i, item in enumerate(data):
-            task = Task(
-                id=item.get("id", f"TASK-{i+1:03d}"),
-                category=item.get("category", "functional"),
-                title=item.get("title", item.get("description", "")[:50]),
-                description=item.get("description", ""),
-                acceptance_criteria=item.get("acceptance_criteria", item.get("steps", [])),
-                passes=item.get("passes", False),
-                files_expected=item.get("files_expected", []),
-                steps=item.get("steps", []),
-            )
-            tasks.append(task)
-        
+        tasks = [_parse_legacy_task(item, i) for i, item in enumerate(data)]
         meta = HandoffMeta(project="Unknown (legacy format)")
         return Handoff(meta=meta, tasks=tasks)
     
     # New format with meta
-    meta_data = data.get("meta", {})
-    meta = HandoffMeta(
-        project=meta_data.get("project", "Unknown"),
-        phase=meta_data.get("phase", "Phase 1"),
-        source=meta_data.get("source", ""),
-        lock=meta_data.get("lock", True),
-    )
-    
-    tasks = []
-    for item in data.get("tasks", []):
-        task = Task(
-            id=item.get("id", ""),
-            category=item.get("category", "functional"),
-            title=item.get("title", ""),
-            description=item.get("description", ""),
-            acceptance_criteria=item.get("acceptance_criteria", []),
-            passes=item.get("passes", False),
-            files_expected=item.get("files_expected", []),
-            steps=item.get("steps", []),
-        )
-        tasks.append(task)
+    meta = _parse_meta(data.get("meta", {}))
+    tasks = [_parse_task(item) for item in data.get("tasks", [])]
     
     return Handoff(meta=meta, tasks=tasks)
 
 
+def _stream_values(events, prefixes, markers=()):
+    """Yield (prefix, value) for each complete JSON value at one of prefixes.
+    
+    Values are assembled with ijson.ObjectBuilder from a single parse
+    stream. For prefixes in markers, (prefix, None) is yielded when a value
+    starts there, without building it.
+    """
+    builder = None
+    for prefix, event, value in events:
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == building and event in ("end_map", "end_array"):
+                yield building, builder.value
+                builder = None
+        elif prefix in markers:
+            if event not in ("map_key", "end_map", "end_array"):
+                yield prefix, None
+        elif prefix in prefixes:
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                building = prefix
+            else:
+                yield prefix, value
+
+
+def _stream_handoff(path: Path) -> Handoff:
+    """Parse a large handoff.json incrementally with ijson.
+    
+    One pass over the file builds 'meta' and one task dict at a time, so
+    only a single task dict is held in memory alongside the resulting Task
+    objects. The result matches json.load + parse_handoff: a later duplicate
+    key replaces earlier ones, and a document that is neither an object nor
+    an array is rejected.
+    """
+    try:
+        with open(path, "rb") as f:
+            events = ijson.parse(f, use_float=True)
+            _, first_event, _ = next(events)
+            
+            # Legacy format: top-level array of tasks
+            if first_event == "start_array":
+                tasks = [
+                    _parse_legacy_task(item, i)
+                    for i, (_, item) in enumerate(_stream_values(events, ("item",)))
+                ]
+                return Handoff(meta=HandoffMeta(project="Unknown (legacy format)"), tasks=tasks)
+            
+            if first_event != "start_map":
+                raise json.JSONDecodeError("Expected a JSON object or array", "", 0)
+            
+            meta_data = {}
+            tasks = []
+            for prefix, value in _stream_values(events, ("meta", "tasks.item"), markers=("tasks",)):
+                if prefix == "tasks":
+                    tasks = []
+                elif prefix == "meta":
+                    meta_data = value
+                else:
+                    tasks.append(_parse_task(value))
+    except (ijson.JSONError, StopIteration) as e:
+        # Surface the same error type as the json.load path
+        raise json.JSONDecodeError(str(e) or "Empty document", "", 0)
+    
+    return Handoff(meta=_parse_meta(meta_data), tasks=tasks)
+
+
 def load_handoff(path: Path) -> Handoff:
-    """Load and parse a handoff.json file."""
+    """Load and parse a handoff.json file.
+    
+    Files larger than STREAM_THRESHOLD_BYTES are stream-parsed with ijson
+    when it is installed.
+    """
+    if IJSON_AVAILABLE and Path(path).stat().st_size >= STREAM_THRESHOLD_BYTES:
+        return _stream_handoff(path)
+    
     with open(path, "r") as f:
         data = json.load(f)
+    if not isinstance(data, (dict, list)):
+        # Same error as the streamed path, rather than failing inside parse_handoff
+        raise json.JSONDecodeError("Expected a JSON object or array", "", 0)
     return parse_handoff(data)
 
 
@@ -213,11 +335,16 @@ def save_handoff(handoff: Handoff, path: Path) -> None:
         json.dump(handoff.to_dict(), f, indent=2)
 
 
-def validate_handoff_file(path: Path) -> list[str]:
-    """Validate a handoff.json file and return list of errors."""
+def validate_handoff_file(path: Path, fail_fast: bool = False) -> list[str]:
+    """Validate a handoff.json file and return list of errors.
+    
+    Args:
+        path: Path to handoff.json
+        fail_fast: Stop at the first error (see Handoff.validate)
+    """
     try:
         handoff = load_handoff(path)
-        return handoff.validate()
+        return handoff.validate(fail_fast=fail_fast)
     except json.JSONDecodeError as e:
         return [f"Invalid JSON: {e}"]
     except Exception as e:
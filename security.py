@@ -7,12 +7,15 @@ Uses an allowlist approach - only explicitly permitted commands can run.
 """
 
 import os
+import re
 import shlex
+from functools import lru_cache
+from typing import Sequence
 
 
 # Allowed commands for development tasks
 # Minimal set needed for the autonomous coding demo
-ALLOWED_COMMANDS = {
+ALLOWED_COMMANDS = frozenset({
     # File inspection
     "ls",
     "cat",
@@ -38,10 +41,152 @@ ALLOWED_COMMANDS = {
     "pkill",  # For killing dev servers; validated separately
     # Script execution
     "init.sh",  # Init scripts; validated separately
-}
+})
 
 # Commands that need additional validation even when in the allowlist
-COMMANDS_NEEDING_EXTRA_VALIDATION = {"pkill", "chmod", "init.sh"}
+COMMANDS_NEEDING_EXTRA_VALIDATION = frozenset({"pkill", "chmod", "init.sh"})
+
+# Command separators. Newlines separate commands in the shell just like ';'.
+_CHAIN_SEPARATORS = ("&&", "||", ";", "\n")
+_SEMI_SEPARATORS = (";", "\n")
+
+# Fast-path splitters for input without quotes or escapes (no lookarounds,
+# so matching stays linear)
+_CHAIN_SPLIT_RE = re.compile(r"&&|\|\||[;\n]")
+_SEMI_SPLIT_RE = re.compile(r"[;\n]")
+
+# Valid chmod modes: +x, u+x, a+x, ug+x, etc.
+_CHMOD_MODE_RE = re.compile(r"^[ugoa]*\+x$")
+
+# Runs of non-whitespace, using shlex's POSIX whitespace set
+_WORD_RE = re.compile(r"[^ \t\r\n]+")
+
+# Shell operators that indicate a new command follows
+_SHELL_OPS = frozenset({"|", "||", "&&", "&"})
+
+# Shell keywords that precede commands
+_SHELL_KEYWORDS = frozenset({
+    "if",
+    "then",
+    "else",
+    "elif",
+    "fi",
+    "for",
+    "while",
+    "until",
+    "do",
+    "done",
+    "case",
+    "esac",
+    "in",
+    "!",
+    "{",
+    "}",
+})
+
+
+def _fast_tokenize(command_string: str) -> list[str]:
+    """
+    Tokenize a command string with the same result as shlex.split.
+
+    Handles the common grammar (whitespace-separated words with simple
+    single/double quoting) in a single pass. Strings containing backslashes
+    are handed to shlex.split, which owns the escape rules.
+
+    Raises:
+        ValueError: On unclosed quotes (same as shlex.split)
+    """
+    if "\\" in command_string:
+        return shlex.split(command_string)
+
+    # No quoting at all: plain whitespace split
+    if "'" not in command_string and '"' not in command_string:
+        return _WORD_RE.findall(command_string)
+
+    tokens = []
+    token = None  # None means no token in progress ('' is a valid token)
+    quote = None
+    for ch in command_string:
+        if quote:
+            if ch == quote:
+                quote = None
+            else:
+                token += ch
+        elif ch in " \t\r\n":
+            if token is not None:
+                tokens.append(token)
+                token = None
+        elif ch == "'" or ch == '"':
+            quote = ch
+            if token is None:
+                token = ""
+        elif token is None:
+            token = ch
+        else:
+            token += ch
+
+    if quote:
+        raise ValueError("No closing quotation")
+    if token is not None:
+        tokens.append(token)
+    return tokens
+
+
+def _split_on_unquoted(
+    command_string: str, separators: tuple[str, ...], fast_re: re.Pattern
+) -> list[str]:
+    """
+    Split a command string on separators that appear outside quotes.
+
+    Single pass over the string tracking quote state: single quotes are
+    literal, backslash escapes the next character outside single quotes.
+    Input without any quote or backslash is split with fast_re instead.
+
+    Args:
+        command_string: The full shell command
+        separators: Separator strings, longest-first where they share a prefix
+        fast_re: Compiled regex matching the same separators
+
+    Returns:
+        List of raw (unstripped) segments
+    """
+    if "'" not in command_string and '"' not in command_string and "\\" not in command_string:
+        return fast_re.split(command_string)
+
+    first_chars = {sep[0] for sep in separators}
+    segments = []
+    start = 0
+    quote = None
+    i = 0
+    n = len(command_string)
+
+    while i < n:
+        ch = command_string[i]
+        if quote == "'":
+            if ch == "'":
+                quote = None
+        elif ch == "\\":
+            i += 2
+            continue
+        elif quote == '"':
+            if ch == '"':
+                quote = None
+        elif ch == "'" or ch == '"':
+            quote = ch
+        elif ch in first_chars:
+            for sep in separators:
+                if command_string.startswith(sep, i):
+                    segments.append(command_string[start:i])
+                    i += len(sep)
+                    start = i
+                    break
+            else:
+                i += 1
+            continue
+        i += 1
+
+    segments.append(command_string[start:])
+    return segments
 
 
 def split_command_segments(command_string: str) -> list[str]:
@@ -56,22 +201,20 @@ def split_command_segments(command_string: str) -> list[str]:
     Returns:
         List of individual command segments
     """
-    import re
+    return list(_split_command_segments(command_string))
 
-    # Split on && and || while preserving the ability to handle each segment
-    # This regex splits on && or || that aren't inside quotes
-    segments = re.split(r"\s*(?:&&|\|\|)\s*", command_string)
 
-    # Further split on semicolons
+@lru_cache(maxsize=1024)
+def _split_command_segments(command_string: str) -> tuple[str, ...]:
+    """Cached implementation of split_command_segments (returns a tuple)."""
+    # Split on &&, || and ; (or newlines) that aren't inside quotes
     result = []
-    for segment in segments:
-        sub_segments = re.split(r'(?<!["\'])\s*;\s*(?!["\'])', segment)
-        for sub in sub_segments:
-            sub = sub.strip()
-            if sub:
-                result.append(sub)
+    for segment in _split_on_unquoted(command_string, _CHAIN_SEPARATORS, _CHAIN_SPLIT_RE):
+        segment = segment.strip()
+        if segment:
+            result.append(segment)
 
-    return result
+    return tuple(result)
 
 
 def extract_commands(command_string: str) -> list[str]:
@@ -87,14 +230,18 @@ def extract_commands(command_string: str) -> list[str]:
     Returns:
         List of command names found in the string
     """
+    return list(_extract_commands(command_string))
+
+
+@lru_cache(maxsize=1024)
+def _extract_commands(command_string: str) -> tuple[str, ...]:
+    """Cached implementation of extract_commands (returns a tuple)."""
     commands = []
 
     # shlex doesn't treat ; as a separator, so we need to pre-process
-    import re
-
-    # Split on semicolons that aren't inside quotes (simple heuristic)
+    # Split on semicolons (and newlines) that aren't inside quotes
     # This handles common cases like "echo hello; ls"
-    segments = re.split(r'(?<!["\'])\s*;\s*(?!["\'])', command_string)
+    segments = _split_on_unquoted(command_string, _SEMI_SEPARATORS, _SEMI_SPLIT_RE)
 
     for segment in segments:
         segment = segment.strip()
@@ -102,11 +249,11 @@ def extract_commands(command_string: str) -> list[str]:
             continue
 
         try:
-            tokens = shlex.split(segment)
+            tokens = _fast_tokenize(segment)
         except ValueError:
             # Malformed command (unclosed quotes, etc.)
             # Return empty to trigger block (fail-safe)
-            return []
+            return ()
 
         if not tokens:
             continue
@@ -116,29 +263,12 @@ def extract_commands(command_string: str) -> list[str]:
 
         for token in tokens:
             # Shell operators indicate a new command follows
-            if token in ("|", "||", "&&", "&"):
+            if token in _SHELL_OPS:
                 expect_command = True
                 continue
 
             # Skip shell keywords that precede commands
-            if token in (
-                "if",
-                "then",
-                "else",
-                "elif",
-                "fi",
-                "for",
-                "while",
-                "until",
-                "do",
-                "done",
-                "case",
-                "esac",
-                "in",
-                "!",
-                "{",
-                "}",
-            ):
+            if token in _SHELL_KEYWORDS:
                 continue
 
             # Skip flags/options
@@ -155,14 +285,14 @@ def extract_commands(command_string: str) -> list[str]:
                 commands.append(cmd)
                 expect_command = False
 
-    return commands
+    return tuple(commands)
 
 
 def validate_pkill_command(command_string: str) -> tuple[bool, str]:
     """
     Validate pkill commands - only allow killing dev-related processes.
 
-    Uses shlex to parse the command, avoiding regex bypass vulnerabilities.
+    Tokenizes the command (shlex-compatible), avoiding regex bypass vulnerabilities.
 
     Returns:
         Tuple of (is_allowed, reason_if_blocked)
@@ -177,7 +307,7 @@ def validate_pkill_command(command_string: str) -> tuple[bool, str]:
     }
 
     try:
-        tokens = shlex.split(command_string)
+        tokens = _fast_tokenize(command_string)
     except ValueError:
         return False, "Could not parse pkill command"
 
@@ -214,7 +344,7 @@ def validate_chmod_command(command_string: str) -> tuple[bool, str]:
         Tuple of (is_allowed, reason_if_blocked)
     """
     try:
-        tokens = shlex.split(command_string)
+        tokens = _fast_tokenize(command_string)
     except ValueError:
         return False, "Could not parse chmod command"
 
@@ -243,9 +373,7 @@ def validate_chmod_command(command_string: str) -> tuple[bool, str]:
 
     # Only allow +x variants (making files executable)
     # This matches: +x, u+x, g+x, o+x, a+x, ug+x, etc.
-    import re
-
-    if not re.match(r"^[ugoa]*\+x$", mode):
+    if not _CHMOD_MODE_RE.match(mode):
         return False, f"chmod only allowed with +x mode, got: {mode}"
 
     return True, ""
@@ -259,7 +387,7 @@ def validate_init_script(command_string: str) -> tuple[bool, str]:
         Tuple of (is_allowed, reason_if_blocked)
     """
     try:
-        tokens = shlex.split(command_string)
+        tokens = _fast_tokenize(command_string)
     except ValueError:
         return False, "Could not parse init script command"
 
@@ -276,7 +404,7 @@ def validate_init_script(command_string: str) -> tuple[bool, str]:
     return False, f"Only ./init.sh is allowed, got: {script}"
 
 
-def get_command_for_validation(cmd: str, segments: list[str]) -> str:
+def get_command_for_validation(cmd: str, segments: Sequence[str]) -> str:
     """
     Find the specific command segment that contains the given command.
 
@@ -288,7 +416,7 @@ def get_command_for_validation(cmd: str, segments: list[str]) -> str:
         The segment containing the command, or empty string if not found
     """
     for segment in segments:
-        segment_commands = extract_commands(segment)
+        segment_commands = _extract_commands(segment)
         if cmd in segment_commands:
             return segment
     return ""
@@ -298,7 +426,9 @@ async def bash_security_hook(input_data, tool_use_id=None, context=None):
     """
     Pre-tool-use hook that validates bash commands using an allowlist.
 
-    Only commands in ALLOWED_COMMANDS are permitted.
+    Only commands in ALLOWED_COMMANDS are permitted. The SDK requires an
+    async hook, but validation is pure CPU work, so all of it runs in the
+    synchronous _decide_bash().
 
     Args:
         input_data: Dict containing tool_name and tool_input
@@ -308,15 +438,45 @@ async def bash_security_hook(input_data, tool_use_id=None, context=None):
     Returns:
         Empty dict to allow, or {"decision": "block", "reason": "..."} to block
     """
+    return _decide_bash(input_data)
+
+
+def _decide_bash(input_data) -> dict:
+    """
+    Synchronous body of bash_security_hook.
+
+    Args:
+        input_data: Dict containing tool_name and tool_input
+
+    Returns:
+        Empty dict to allow, or {"decision": "block", "reason": "..."} to block
+    """
+    # Most tool-use events aren't Bash; reject them with a single lookup
     if input_data.get("tool_name") != "Bash":
         return {}
 
-    command = input_data.get("tool_input", {}).get("command", "")
+    tool_input = input_data.get("tool_input")
+    command = tool_input.get("command") if tool_input else None
     if not command:
         return {}
 
+    # Copy so callers can't mutate the cached decision
+    return dict(_decide(command))
+
+
+@lru_cache(maxsize=1024)
+def _decide(command: str) -> dict:
+    """
+    Compute the allow/block decision for a bash command string.
+
+    Pure function of the command text, so decisions are memoized; callers
+    must copy the returned dict before handing it out.
+
+    Returns:
+        Empty dict to allow, or {"decision": "block", "reason": "..."} to block
+    """
     # Extract all commands from the command string
-    commands = extract_commands(command)
+    commands = _extract_commands(command)
 
     if not commands:
         # Could not parse - fail safe by blocking
@@ -325,35 +485,46 @@ async def bash_security_hook(input_data, tool_use_id=None, context=None):
             "reason": f"Could not parse command for security validation: {command}",
         }
 
-    # Split into segments for per-command validation
-    segments = split_command_segments(command)
+    # Check all commands against the allowlist in one C-level subset test;
+    # only walk the list to report the first offender
+    if not ALLOWED_COMMANDS.issuperset(commands):
+        cmd = next(c for c in commands if c not in ALLOWED_COMMANDS)
+        return {
+            "decision": "block",
+            "reason": f"Command '{cmd}' is not in the allowed commands list",
+        }
+
+    # Additional validation for sensitive commands. Segments are only split
+    # if a sensitive command is actually present.
+    if COMMANDS_NEEDING_EXTRA_VALIDATION.isdisjoint(commands):
+        return {}
+
+    # Index the first segment each command appears in
+    # (same result as get_command_for_validation)
+    cmd_to_segment = {}
+    for segment in _split_command_segments(command):
+        for segment_cmd in _extract_commands(segment):
+            cmd_to_segment.setdefault(segment_cmd, segment)
 
-    # Check each command against the allowlist
     for cmd in commands:
-        if cmd not in ALLOWED_COMMANDS:
-            return {
-                "decision": "block",
-                "reason": f"Command '{cmd}' is not in the allowed commands list",
-            }
-
-        # Additional validation for sensitive commands
-        if cmd in COMMANDS_NEEDING_EXTRA_VALIDATION:
-            # Find the specific segment containing this command
-            cmd_segment = get_command_for_validation(cmd, segments)
-            if not cmd_segment:
-                cmd_segment = command  # Fallback to full command
-
-            if cmd == "pkill":
-                allowed, reason = validate_pkill_command(cmd_segment)
-                if not allowed:
-                    return {"decision": "block", "reason": reason}
-            elif cmd == "chmod":
-                allowed, reason = validate_chmod_command(cmd_segment)
-                if not allowed:
-                    return {"decision": "block", "reason": reason}
-            elif cmd == "init.sh":
-                allowed, reason = validate_init_script(cmd_segment)
-                if not allowed:
-                    return {"decision": "block", "reason": reason}
+        if cmd not in COMMANDS_NEEDING_EXTRA_VALIDATION:
+            continue
+
+        # Find the specific segment containing this command,
+        # falling back to the full command
+        cmd_segment = cmd_to_segment.get(cmd, command)
+
+        if cmd == "pkill":
+            allowed, reason = validate_pkill_command(cmd_segment)
+            if not allowed:
+                return {"decision": "block", "reason": reason}
+        elif cmd == "chmod":
+            allowed, reason = validate_chmod_command(cmd_segment)
+            if not allowed:
+                return {"decision": "block", "reason": reason}
+        elif cmd == "init.sh":
+            allowed, reason = validate_init_script(cmd_segment)
+            if not allowed:
+                return {"decision": "block", "reason": reason}
 
     return {}
@@ -8,13 +8,21 @@ crash recovery, and UUID-based IDs.
 
 import os
 import json
-import uuid
-from dataclasses import dataclass, field, asdict
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields, is_dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import Optional, Dict, Any, Union
 import logging
 
+# Optional fast JSON backend for state.json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +31,31 @@ COMMANDER_HOME = Path.home() / ".cloud-harness"
 STATE_FILE = COMMANDER_HOME / "state.json"
 STATE_FILE_TMP = STATE_FILE.with_suffix(".json.tmp")
 
+# fsync state writes for durability; set CHARNESS_STATE_FSYNC=0 to skip
+# (the temp + rename write is still atomic, only power-loss durability is lost)
+_FSYNC = os.environ.get("CHARNESS_STATE_FSYNC", "1") == "1"
+
+
+class _DataclassEncoder(json.JSONEncoder):
+    """JSON encoder that serializes dataclasses field-by-field.
+
+    Unlike asdict(), this doesn't deep-copy the object tree first; nested
+    dataclasses are encoded as the encoder reaches them.
+    """
+
+    def default(self, o):
+        if is_dataclass(o) and not isinstance(o, type):
+            return {f.name: getattr(o, f.name) for f in fields(o)}
+        return super().default(o)
+
+
+def _encode_state(data: Union[dict, "State"]) -> bytes:
+    """Serialize state (dict or State) to indented JSON bytes."""
+    # orjson serializes dataclasses natively
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, cls=_DataclassEncoder).encode("utf-8")
+
 
 @dataclass
 class InboxItem:
@@ -35,7 +68,7 @@ class InboxItem:
     def __post_init__(self):
         """Ensure ID is set."""
         if not self.id:
-            self.id = str(uuid.uuid4())
+            self.id = generate_uuid()
 
 
 @dataclass
@@ -50,7 +83,7 @@ class Task:
     def __post_init__(self):
         """Ensure ID is set."""
         if not self.id:
-            self.id = str(uuid.uuid4())
+            self.id = generate_uuid()
 
 
 @dataclass
@@ -69,7 +102,7 @@ class Run:
     def __post_init__(self):
         """Ensure ID is set."""
         if not self.id:
-            self.id = str(uuid.uuid4())
+            self.id = generate_uuid()
 
 
 @dataclass
@@ -79,12 +112,27 @@ class Project:
     name: str
     repoPath: str
     status: str
-    lastTouchedAt: str = field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
+    lastTouchedAt: str = field(default_factory=lambda: get_timestamp())
 
     def __post_init__(self):
         """Ensure ID is set."""
         if not self.id:
-            self.id = str(uuid.uuid4())
+            self.id = generate_uuid()
+
+
+# Known fields per dataclass; unknown keys in state.json are dropped on load
+# so files written by newer/older versions still parse
+_PROJECT_FIELDS = frozenset(f.name for f in fields(Project))
+_RUN_FIELDS = frozenset(f.name for f in fields(Run))
+_TASK_FIELDS = frozenset(f.name for f in fields(Task))
+_INBOX_FIELDS = frozenset(f.name for f in fields(InboxItem))
+
+
+def _known(data: dict, known_fields: frozenset) -> dict:
+    """Return only the keys of data that are dataclass fields."""
+    if data.keys() <= known_fields:
+        return data
+    return {k: v for k, v in data.items() if k in known_fields}
 
 
 @dataclass
@@ -97,33 +145,89 @@ class State:
     inbox: list[InboxItem] = field(default_factory=list)
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """Convert to dictionary for JSON serialization.
+
+        Items hold only scalar fields, so a shallow copy of each instance
+        dict equals asdict() without its recursive field walk and deep copy.
+        """
+        return {
+            "focusProjectId": self.focusProjectId,
+            "projects": [dict(vars(p)) for p in self.projects],
+            "runs": [dict(vars(r)) for r in self.runs],
+            "tasks": [dict(vars(t)) for t in self.tasks],
+            "inbox": [dict(vars(i)) for i in self.inbox],
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "State":
         """Create State from dictionary."""
         return cls(
             focusProjectId=data.get("focusProjectId"),
-            projects=[Project(**p) for p in data.get("projects", [])],
-            runs=[Run(**r) for r in data.get("runs", [])],
-            tasks=[Task(**t) for t in data.get("tasks", [])],
-            inbox=[InboxItem(**i) for i in data.get("inbox", [])],
+            projects=[Project(**_known(p, _PROJECT_FIELDS)) for p in data.get("projects", [])],
+            runs=[Run(**_known(r, _RUN_FIELDS)) for r in data.get("runs", [])],
+            tasks=[Task(**_known(t, _TASK_FIELDS)) for t in data.get("tasks", [])],
+            inbox=[InboxItem(**_known(i, _INBOX_FIELDS)) for i in data.get("inbox", [])],
         )
 
 
+def _decode_state(raw: bytes) -> State:
+    """Parse state.json bytes into a State.
+
+    Decoding goes through plain dicts and from_dict(), so files with null
+    IDs (filled in by __post_init__) or loosely typed fields still load.
+    """
+    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    return State.from_dict(data)
+
+
+def _sync_data(fd: int) -> None:
+    """Flush a file's data to disk.
+
+    Uses fdatasync where available: the temp file's contents and size are
+    flushed, but not timestamps, which the rename makes irrelevant anyway.
+    """
+    if hasattr(os, "fdatasync"):
+        os.fdatasync(fd)
+    else:
+        os.fsync(fd)
+
+
+def _stat_key(path: Path) -> tuple[int, int, int]:
+    """Identity of a file's current contents: (inode, mtime ns, size)."""
+    st = os.stat(path)
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
 class StateManager:
     """Manages Commander state with atomic writes and crash recovery."""
 
-    def __init__(self, state_path: Path = STATE_FILE):
+    def __init__(self, state_path: Path = STATE_FILE, durable: Optional[bool] = None):
         """Initialize state manager.
 
         Args:
             state_path: Path to state.json file
+            durable: fsync each write before the rename; defaults to
+                CHARNESS_STATE_FSYNC (on unless set to 0)
         """
         self.state_path = state_path
+        self.durable = _FSYNC if durable is None else durable
         self.state_tmp_path = state_path.with_suffix(".json.tmp")
         self.state: Optional[State] = None
+        # id -> position indexes per State list, keyed by attribute name.
+        # Each entry is (list, index); hits are checked against the list.
+        self._indexes: Dict[str, tuple[list, Dict[str, int]]] = {}
+        # Nesting depth of batch() blocks and whether a save was deferred
+        self._batch_depth = 0
+        self._batch_pending = False
+        # Bytes last read from / written to state_path; a save whose payload
+        # matches is skipped (state is clean)
+        self._persisted: Optional[bytes] = None
+        # (st_ino, st_mtime_ns, st_size) of state_path when _persisted was
+        # read/written; lets load_state skip re-parsing an unchanged file
+        self._persisted_stat: Optional[tuple[int, int, int]] = None
+        # A save was requested but has not reached disk (deferred by batch(),
+        # dropped, or failed), so the loaded State no longer matches the file
+        self._dirty = False
 
     def ensure_directories(self) -> None:
         """Ensure Commander home directory exists."""
@@ -140,44 +244,78 @@ class StateManager:
             self.state_tmp_path.unlink()
             logger.info("Cleaned up incomplete state file")
 
-    def atomic_write(self, data: dict) -> None:
-        """Write state atomically (temp + fsync + rename).
+    def atomic_write(self, data: Union[dict, State, bytes]) -> None:
+        """Write state atomically (temp + fdatasync + rename).
+
+        The sync is skipped when the manager is not durable (durable=False or
+        CHARNESS_STATE_FSYNC=0); the write is still atomic.
 
         This ensures that crashes during write don't corrupt state.
 
         Args:
-            data: Dictionary to write to state file
+            data: Dictionary or State (serialized without an asdict copy)
+                to write to state file, or already-encoded bytes
         """
-        # Write to temp file
-        with open(self.state_tmp_path, "w") as f:
-            json.dump(data, f, indent=2)
-            f.flush()
-            os.fsync(f.fileno())
+        payload = data if isinstance(data, bytes) else _encode_state(data)
+
+        # Write to temp file via a raw fd (no buffered file object); state
+        # is private to the user, so create it 0600
+        fd = os.open(self.state_tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            view = memoryview(payload)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            if self.durable:
+                _sync_data(fd)
+        finally:
+            os.close(fd)
 
         # Atomic rename (POSIX guarantees this is atomic)
-        self.state_tmp_path.replace(self.state_path)
+        os.replace(self.state_tmp_path, self.state_path)
+        self._persisted = payload
+        self._persisted_stat = _stat_key(self.state_path)
 
         logger.debug(f"Atomic state write complete: {self.state_path}")
 
     def load_state(self) -> State:
         """Load state from disk, handling missing or corrupt files.
 
+        If the file is unchanged since it was last loaded or saved (same
+        inode, mtime and size) and no save is outstanding, the loaded State
+        is returned without re-parsing. Edits made directly on that State
+        are kept until save_state() writes them.
+
         Returns:
             State object (empty State if file doesn't exist)
         """
         self.ensure_directories()
         self.recover_from_crash()
 
-        if not self.state_path.exists():
+        try:
+            stat_key = _stat_key(self.state_path)
+        except FileNotFoundError:
             logger.info("State file does not exist, creating new state")
             self.state = State()
+            self._indexes.clear()
+            self._persisted = None
+            self._persisted_stat = None
+            self._dirty = False
+            return self.state
+
+        # Unchanged file and no unsaved changes: nothing to re-parse
+        if self.state is not None and not self._dirty and stat_key == self._persisted_stat:
+            logger.debug("State file unchanged, reusing loaded state")
             return self.state
 
         try:
-            with open(self.state_path, "r") as f:
-                data = json.load(f)
+            raw = self.state_path.read_bytes()
+            self.state = _decode_state(raw)
 
-            self.state = State.from_dict(data)
+            self._indexes.clear()
+            self._persisted = raw
+            self._persisted_stat = stat_key
+            self._dirty = False
             logger.debug(f"Loaded state from {self.state_path}")
             return self.state
 
@@ -194,16 +332,63 @@ class StateManager:
     def save_state(self) -> None:
         """Save current state to disk atomically.
 
+        The write is skipped when the serialized state is identical to what
+        was last loaded or saved. Comparing content rather than relying on
+        _dirty also catches callers that mutate state objects in place (e.g.
+        the reconciler parking runs) before saving.
+
         Raises:
             RuntimeError: If no state is loaded
         """
         if self.state is None:
             raise RuntimeError("No state loaded. Call load_state() first.")
 
+        # Cleared only once the state is known to be on disk
+        self._dirty = True
+        if self._batch_depth:
+            self._batch_pending = True
+            return
+
+        payload = _encode_state(self.state)
+        if payload == self._persisted and self.state_path.exists():
+            logger.debug("State unchanged, skipping save")
+            self._dirty = False
+            return
+
         self.ensure_directories()
-        self.atomic_write(self.state.to_dict())
+        self.atomic_write(payload)
+        self._dirty = False
         logger.info("State saved successfully")
 
+    @contextmanager
+    def batch(self):
+        """Defer saves until the outermost batch block exits.
+
+        Any save_state()/update_state() calls inside the block are collapsed
+        into a single write on exit. If the outermost block raises, the
+        deferred write is dropped so a half-applied change never reaches
+        disk; the in-memory state is left as is until load_state() re-reads
+        the file.
+
+        Example:
+            with state_mgr.batch():
+                for item in items:
+                    state.inbox.append(item)
+                    state_mgr.save_state()
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._batch_pending = False
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._batch_pending:
+            self._batch_pending = False
+            self.save_state()
+
     def update_state(self, new_state: State) -> None:
         """Replace current state and save atomically.
 
@@ -211,6 +396,7 @@ class StateManager:
             new_state: New state to save
         """
         self.state = new_state
+        self._indexes.clear()
         self.save_state()
 
     def get_project(self, project_id: str) -> Optional[Project]:
@@ -222,9 +408,7 @@ class StateManager:
         Returns:
             Project if found, None otherwise
         """
-        if not self.state:
-            return None
-        return next((p for p in self.state.projects if p.id == project_id), None)
+        return self._lookup("projects", project_id)
 
     def get_run(self, run_id: str) -> Optional[Run]:
         """Get a run by ID.
@@ -235,9 +419,7 @@ class StateManager:
         Returns:
             Run if found, None otherwise
         """
-        if not self.state:
-            return None
-        return next((r for r in self.state.runs if r.id == run_id), None)
+        return self._lookup("runs", run_id)
 
     def get_inbox_item(self, item_id: str) -> Optional[InboxItem]:
         """Get an inbox item by ID.
@@ -248,24 +430,82 @@ class StateManager:
         Returns:
             InboxItem if found, None otherwise
         """
+        return self._lookup("inbox", item_id)
+
+    def _lookup(self, attr: str, item_id: str) -> Optional[Any]:
+        """Look up an item by ID in one of the State lists via a dict index.
+
+        The index maps IDs to list positions. A hit is used only if the item
+        at that position still has the ID; otherwise (or on a miss) the index
+        is rebuilt, so callers that edit the lists directly still get correct
+        results before calling update_state().
+
+        Args:
+            attr: Name of the State list ("projects", "runs", "inbox")
+            item_id: UUID of the item
+
+        Returns:
+            The first item with a matching ID, None otherwise
+        """
         if not self.state:
             return None
-        return next((i for i in self.state.inbox if i.id == item_id), None)
+
+        items = getattr(self.state, attr)
+        cached = self._indexes.get(attr)
+        if cached is not None and cached[0] is items:
+            i = cached[1].get(item_id)
+            if i is not None and i < len(items) and items[i].id == item_id:
+                return items[i]
+
+        # Stale entry or miss: the list may have been edited in place
+        index: Dict[str, int] = {}
+        for i, item in enumerate(items):
+            # setdefault keeps the first position on duplicate IDs
+            index.setdefault(item.id, i)
+        self._indexes[attr] = (items, index)
+        i = index.get(item_id)
+        return None if i is None else items[i]
 
 
 def generate_uuid() -> str:
     """Generate a new UUID v4.
 
+    Formats os.urandom() bytes directly, skipping the uuid.UUID object;
+    the result is identical in shape to str(uuid.uuid4()).
+
     Returns:
         UUID string
     """
-    return str(uuid.uuid4())
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last formatted timestamp
+_timestamp_prefix = (None, "")
 
 
 def get_timestamp() -> str:
     """Get current ISO 8601 timestamp.
 
+    Same format as datetime.utcnow().isoformat() + "Z", built from
+    time.time_ns() with the per-second prefix cached between calls.
+
     Returns:
         ISO 8601 formatted timestamp
     """
-    return datetime.utcnow().isoformat() + "Z"
+    global _timestamp_prefix
+
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _timestamp_prefix
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _timestamp_prefix = (seconds, prefix)
+
+    micros = nanos // 1000
+    if micros:
+        return f"{prefix}.{micros:06d}Z"
+    # isoformat() omits the fraction when it is zero
+    return f"{prefix}Z"
@@ -8,9 +8,11 @@ Run with: python test_security.py
 """
 
 import asyncio
+import shlex
 import sys
 
 from security import (
+    _fast_tokenize,
     bash_security_hook,
     extract_commands,
     validate_chmod_command,
@@ -69,6 +71,44 @@ def check_extract_commands():
     return passed, failed
 
 
+def check_fast_tokenize():
+    """Test that the fast tokenizer matches shlex.split."""
+    print("\nTesting fast tokenizer:\n")
+    passed = 0
+    failed = 0
+
+    test_cases = [
+        "",
+        "ls -la",
+        "git commit -m 'fix the thing'",
+        'echo "a b"c\'d\'',
+        "pkill -f 'node server.js'",
+        "echo ''",
+        "a\tb\nc",
+        'echo "escaped \\" quote"',
+        "echo 'unclosed",
+    ]
+
+    for cmd in test_cases:
+        try:
+            expected = shlex.split(cmd)
+        except ValueError:
+            expected = ValueError
+        try:
+            result = _fast_tokenize(cmd)
+        except ValueError:
+            result = ValueError
+        if result == expected:
+            print(f"  PASS: {cmd!r} -> {result}")
+            passed += 1
+        else:
+            print(f"  FAIL: {cmd!r}")
+            print(f"         Expected: {expected}, Got: {result}")
+            failed += 1
+
+    return passed, failed
+
+
 def check_validate_chmod():
     """Test chmod command validation."""
     print("\nTesting chmod validation:\n")
@@ -164,6 +204,11 @@ def main():
     passed += ext_passed
     failed += ext_failed
 
+    # Test tokenizer
+    tok_passed, tok_failed = check_fast_tokenize()
+    passed += tok_passed
+    failed += tok_failed
+
     # Test chmod validation
     chmod_passed, chmod_failed = check_validate_chmod()
     passed += chmod_passed
@@ -198,6 +243,9 @@ def main():
         "$(echo pkill) node",
         'eval "pkill node"',
         'bash -c "pkill node"',
+        # Separators hidden behind escaped quotes or newlines
+        "ls \\'; rm -rf /",
+        "ls\nrm -rf /",
         # chmod with disallowed modes
         "chmod 777 file.sh",
         "chmod 755 file.sh",
@@ -239,6 +287,7 @@ def main():
         "git status",
         "git commit -m 'test'",
         "git add . && git commit -m 'msg'",
+        "git commit -m 'fix: a; b && c'",
         # Process management
         "ps aux",
         "lsof -i :3000",
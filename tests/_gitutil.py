@@ -0,0 +1,67 @@
+"""Git helpers shared by the tests that build real repositories."""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+# Resolve git once so each spawn execs an absolute path instead of searching PATH
+GIT = shutil.which("git") or "git"
+# Upper bound for a single test-side git call, so a wedged git fails instead of hanging
+GIT_TIMEOUT = 10
+
+
+def git_env(repo_path: Path) -> dict:
+    """Environment that points git straight at repo_path, skipping repo discovery."""
+    return {
+        **os.environ,
+        "GIT_DIR": str(repo_path / ".git"),
+        "GIT_WORK_TREE": str(repo_path),
+        "GIT_DISCOVERY_ACROSS_FILESYSTEM": "0",
+        "GIT_TERMINAL_PROMPT": "0",
+    }
+
+
+def run_git(repo_path: Path, args: list) -> None:
+    """Run a git command against repo_path, raising on failure or timeout."""
+    subprocess.run(
+        [GIT] + args, cwd=repo_path, env=git_env(repo_path), check=True,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=GIT_TIMEOUT,
+    )
+
+
+def init_repo(repo_path: Path) -> None:
+    """Create a repo on branch 'main' with a test identity and one empty commit."""
+    # No hook templates to copy. symbolic-ref rather than --initial-branch,
+    # which needs git 2.28+, to start on 'main' regardless of init.defaultBranch
+    run_git(repo_path, ["init", "-q", "--template="])
+    run_git(repo_path, ["symbolic-ref", "HEAD", "refs/heads/main"])
+    # Configure git identity for CI environment where global config may be missing
+    run_git(repo_path, ["config", "user.email", "test@example.com"])
+    run_git(repo_path, ["config", "user.name", "Test User"])
+    # Empty tree: tests check branches and metadata, not checkout contents
+    run_git(repo_path, ["commit", "-q", "--allow-empty", "-m", "Initial commit"])
+
+
+def branch_exists(repo_path: Path, branch: str) -> bool:
+    """Check for a local branch by reading refs directly instead of running git."""
+    git_dir = repo_path / ".git"
+    if (git_dir / "refs" / "heads" / branch).exists():
+        return True
+    packed_refs = git_dir / "packed-refs"
+    if not packed_refs.exists():
+        return False
+    ref = f"refs/heads/{branch}"
+    return any(line.split(" ", 1)[-1] == ref for line in packed_refs.read_text().splitlines())
+
+
+def registered_worktrees(repo_path: Path) -> list:
+    """List worktree paths git has registered, read from .git/worktrees/*/gitdir."""
+    worktrees_dir = repo_path / ".git" / "worktrees"
+    if not worktrees_dir.exists():
+        return []
+    return [
+        str(Path((entry / "gitdir").read_text().strip()).parent)
+        for entry in worktrees_dir.iterdir()
+        if (entry / "gitdir").exists()
+    ]
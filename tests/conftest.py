@@ -0,0 +1,37 @@
+"""Shared pytest configuration for the harness test suite."""
+
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Make the top-level modules importable once per session (per worker under xdist)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _worker_tmp(tmp_path_factory):
+    """Root default tempfile dirs under one per-worker parent for the session.
+
+    Tests keep calling tempfile.mkdtemp()/TemporaryDirectory() as before; with
+    tempfile.tempdir pointed here they land under a single directory per xdist
+    worker, which is removed in one walk at the end. HARNESS_TEST_TMP overrides
+    the base (e.g. a tmpfs mount).
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    base = os.environ.get("HARNESS_TEST_TMP")
+    if base:
+        root = Path(tempfile.mkdtemp(prefix=f"harness-{worker}-", dir=base))
+    else:
+        root = tmp_path_factory.mktemp(f"harness-{worker}")
+
+    previous = tempfile.tempdir
+    tempfile.tempdir = str(root)
+    try:
+        yield root
+    finally:
+        tempfile.tempdir = previous
+        shutil.rmtree(root, ignore_errors=True)
@@ -1,17 +1,68 @@
 import unittest
-import tempfile
+import io
+import os
 import shutil
-import json
+import tarfile
 from pathlib import Path
 from datetime import datetime, timedelta
-import sys
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from pyfakefs import fake_filesystem_unittest
 
 import doc_check
 
 
+def _build_tar(files):
+    """Pack a {name: text} mapping into an in-memory tar archive."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        for name, text in files.items():
+            data = text.encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+# Project tree for TestDocChecker: a README documenting some flags, an agent
+# guide documenting some files, a harness.py with CLI flags, and sample
+# public, private and test modules.
+_FIXTURE_TAR = _build_tar({
+    'README.md': """
+# Test Project
+
+## Usage
+
+```bash
+c-harness start my-app `--repo-path` ../target `--mode` greenfield
+c-harness finish my-app `--force`
+```
+""",
+    'AGENT_GUIDE.md': """
+# Agent Guide
+
+## Core Architecture
+
+- **`harness.py`**: Main CLI entry point
+- **`lifecycle.py`**: Git lifecycle management
+""",
+    'harness.py': """
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--test-flag", help="Test flag")
+parser.add_argument("--another-flag", help="Another flag")
+parser.add_argument("--mode", choices=["greenfield", "brownfield"])
+""",
+    'public_module.py': '# Public module',
+    'another_public.py': '# Another public module',
+    '_private.py': '# Private module',
+    'test_should_be_ignored.py': '# Test file',
+})
+
+# Only trusted archives built above are extracted; use the safe filter where available
+_EXTRACT_KWARGS = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+
 class TestDocDrift(unittest.TestCase):
     """Test DocDrift dataclass."""
 
@@ -44,62 +95,29 @@ class TestDocDecision(unittest.TestCase):
         self.assertIsNotNone(decision.timestamp)
 
 
-class TestDocChecker(unittest.TestCase):
+class TestDocChecker(fake_filesystem_unittest.TestCase):
     """Test DocChecker class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.test_dir = tempfile.mkdtemp()
-        self.test_dir_path = Path(self.test_dir)
+    @classmethod
+    def setUpClass(cls):
+        """Set up read-only fixtures shared by every test in the class."""
+        cls.setUpClassPyfakefs()
+        cls.test_dir_path = Path("/fake/test")
+        cls.test_dir_path.mkdir(parents=True)
 
-        # Create sample README.md
-        self.readme_path = self.test_dir_path / "README.md"
-        self.readme_path.write_text("""
-# Test Project
+        with tarfile.open(fileobj=io.BytesIO(_FIXTURE_TAR)) as tar:
+            tar.extractall(cls.test_dir_path, **_EXTRACT_KWARGS)
 
-## Usage
-
-```bash
-c-harness start my-app `--repo-path` ../target `--mode` greenfield
-c-harness finish my-app `--force`
-```
-""")
-
-        # Create sample AGENT_GUIDE.md
-        self.agent_guide_path = self.test_dir_path / "AGENT_GUIDE.md"
-        self.agent_guide_path.write_text("""
-# Agent Guide
-
-## Core Architecture
-
-- **`harness.py`**: Main CLI entry point
-- **`lifecycle.py`**: Git lifecycle management
-""")
-
-        # Create sample harness.py with CLI flags
-        self.harness_path = self.test_dir_path / "harness.py"
-        self.harness_path.write_text("""
-import argparse
-
-parser = argparse.ArgumentParser()
-parser.add_argument("--test-flag", help="Test flag")
-parser.add_argument("--another-flag", help="Another flag")
-parser.add_argument("--mode", choices=["greenfield", "brownfield"])
-""")
-
-        # Create sample public Python files
-        (self.test_dir_path / "public_module.py").write_text("# Public module")
-        (self.test_dir_path / "another_public.py").write_text("# Another public module")
-        (self.test_dir_path / "_private.py").write_text("# Private module")
-        (self.test_dir_path / "test_should_be_ignored.py").write_text("# Test file")
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.test_dir)
+        cls.readme_path = cls.test_dir_path / "README.md"
+        cls.agent_guide_path = cls.test_dir_path / "AGENT_GUIDE.md"
+        cls.harness_path = cls.test_dir_path / "harness.py"
+        # DocChecker only caches scans keyed by directory mtime, so one
+        # instance can serve every test over the shared fixture dir
+        cls.checker = doc_check.DocChecker(cls.test_dir_path)
 
     def test_extract_cli_flags(self):
         """Test extracting CLI flags from harness.py."""
-        checker = doc_check.DocChecker(self.test_dir_path)
+        checker = self.checker
         flags = checker._extract_cli_flags(self.harness_path)
 
         self.assertIn('--test-flag', flags)
@@ -108,7 +126,7 @@ parser.add_argument("--mode", choices=["greenfield", "brownfield"])
 
     def test_extract_documented_flags(self):
         """Test extracting documented flags from README."""
-        checker = doc_check.DocChecker(self.test_dir_path)
+        checker = self.checker
         flags = checker._extract_documented_flags(self.readme_path)
 
         # README has --repo-path, --mode, --force
@@ -118,7 +136,7 @@ parser.add_argument("--mode", choices=["greenfield", "brownfield"])
 
     def test_detect_cli_flag_drift(self):
         """Test detection of undocumented CLI flags."""
-        checker = doc_check.DocChecker(self.test_dir_path)
+        checker = self.checker
         drift = checker.detect_cli_flag_drift(self.harness_path)
 
         # --test-flag and --another-flag are in harness.py but not in README
@@ -134,7 +152,7 @@ parser.add_argument("--mode", choices=["greenfield", "brownfield"])
 
     def test_get_public_python_files(self):
         """Test getting public Python files."""
-        checker = doc_check.DocChecker(self.test_dir_path)
+        checker = self.checker
         files = checker._get_public_python_files(self.test_dir_path)
 
         # Should include public files
@@ -145,9 +163,25 @@ parser.add_argument("--mode", choices=["greenfield", "brownfield"])
         self.assertNotIn('_private.py', files)
         self.assertNotIn('test_should_be_ignored.py', files)
 
+    def test_public_python_files_cache_tracks_directory_changes(self):
+        """Test that cached scans are refreshed when the directory changes."""
+        # Outside the shared fixture dir, so other tests never see these files
+        project = Path("/fake/scan_cache")
+        project.mkdir()
+        self.addCleanup(shutil.rmtree, project)
+        (project / "first.py").write_text("")
+        checker = doc_check.DocChecker(project)
+
+        self.assertEqual(checker._get_public_python_files(project), {'first.py'})
+
+        (project / "second.py").write_text("")
+        # Force a distinct mtime in case both writes land in the same clock tick
+        os.utime(project, ns=(0, project.stat().st_mtime_ns + 1))
+        self.assertEqual(checker._get_public_python_files(project), {'first.py', 'second.py'})
+
     def test_extract_documented_files(self):
         """Test extracting documented files from AGENT_GUIDE."""
-        checker = doc_check.DocChecker(self.test_dir_path)
+        checker = self.checker
         files = checker._extract_documented_files(self.agent_guide_path)
 
         # AGENT_GUIDE has harness.py and lifecycle.py
@@ -156,7 +190,7 @@ parser.add_argument("--mode", choices=["greenfield", "brownfield"])
 
     def test_detect_public_file_drift(self):
         """Test detection of undocumented public files."""
-        checker = doc_check.DocChecker(self.test_dir_path)
+        checker = self.checker
         drift = checker.detect_public_file_drift(self.agent_guide_path)
 
         # public_module.py and another_public.py are not documented
@@ -168,7 +202,7 @@ parser.add_argument("--mode", choices=["greenfield", "brownfield"])
 
     def test_detect_all_drift(self):
         """Test detection of all drift types."""
-        checker = doc_check.DocChecker(self.test_dir_path)
+        checker = self.checker
         drift = checker.detect_all_drift()
 
         # Should have both CLI flag drift and public file drift
@@ -180,23 +214,27 @@ parser.add_argument("--mode", choices=["greenfield", "brownfield"])
         self.assertGreater(len(drift), 0)
 
 
-class TestDocDecisionStore(unittest.TestCase):
+class TestDocDecisionStore(fake_filesystem_unittest.TestCase):
     """Test DocDecisionStore class."""
 
     def setUp(self):
         """Set up test fixtures."""
-        self.test_dir = tempfile.mkdtemp()
-        self.test_dir_path = Path(self.test_dir)
-        self.store = doc_check.DocDecisionStore(self.test_dir_path)
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.test_dir)
+        self.setUpPyfakefs()
+        self.test_dir_path = Path("/fake/test")
+        self.test_dir_path.mkdir(parents=True)
+        # Most tests only need in-memory behaviour; persistence tests build their own store
+        self.store = doc_check.DocDecisionStore(self.test_dir_path, persist=False)
 
     def test_create_harness_directory(self):
         """Test that .harness directory is created."""
-        self.assertTrue(self.store.decisions_dir.exists())
-        self.assertEqual(self.store.decisions_dir.name, '.harness')
+        store = doc_check.DocDecisionStore(self.test_dir_path)
+        self.assertTrue(store.decisions_dir.exists())
+        self.assertEqual(store.decisions_dir.name, '.harness')
+
+    def test_in_memory_store_skips_disk(self):
+        """Test that a non-persistent store never writes decisions."""
+        self.store.set_decision('cli_flag:--test-flag', 'internal')
+        self.assertFalse(self.store.decisions_dir.exists())
 
     def test_set_and_get_decision(self):
         """Test setting and getting decisions."""
@@ -211,7 +249,8 @@ class TestDocDecisionStore(unittest.TestCase):
     def test_save_and_load(self):
         """Test persisting decisions to disk."""
         item_id = 'cli_flag:--test-flag'
-        self.store.set_decision(item_id, 'deferred', 'Test description')
+        store = doc_check.DocDecisionStore(self.test_dir_path)
+        store.set_decision(item_id, 'deferred', 'Test description')
 
         # Create new store instance to test loading
         new_store = doc_check.DocDecisionStore(self.test_dir_path)
@@ -247,14 +286,10 @@ class TestDocDecisionStore(unittest.TestCase):
         self.store.set_decision(item_id, 'deferred')
         self.assertFalse(self.store.should_ask_again(item_id))
 
-        # Modify timestamp to simulate expired defer
-        decision_data = json.loads(self.store.decisions_file.read_text())
+        # Backdate the in-memory decision to simulate expired defer
+        # (persistence is covered by test_save_and_load)
         old_time = (datetime.now() - timedelta(days=8)).isoformat()
-        decision_data[item_id]['timestamp'] = old_time
-        self.store.decisions_file.write_text(json.dumps(decision_data))
-
-        # Reload store
-        self.store._load()
+        self.store.decisions[item_id].timestamp = old_time
         self.assertTrue(self.store.should_ask_again(item_id))
 
     def test_get_pending_items(self):
@@ -284,13 +319,14 @@ class TestDocDecisionStore(unittest.TestCase):
         self.assertEqual(pending[0].item, '--public-flag')
 
 
-class TestIntegration(unittest.TestCase):
+class TestIntegration(fake_filesystem_unittest.TestCase):
     """Integration tests for doc_check module."""
 
     def setUp(self):
         """Set up test fixtures."""
-        self.test_dir = tempfile.mkdtemp()
-        self.test_dir_path = Path(self.test_dir)
+        self.setUpPyfakefs()
+        self.test_dir_path = Path("/fake/test")
+        self.test_dir_path.mkdir(parents=True)
 
         # Create minimal project structure
         self.readme_path = self.test_dir_path / "README.md"
@@ -302,10 +338,6 @@ class TestIntegration(unittest.TestCase):
         self.harness_path = self.test_dir_path / "harness.py"
         self.harness_path.write_text('parser.add_argument("--new-flag")')
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.test_dir)
-
     def test_check_drift_before_finish(self):
         """Test main entry point for drift detection."""
         has_drift, drift_items, store = doc_check.check_drift_before_finish(self.test_dir_path)
@@ -319,13 +351,16 @@ class TestIntegration(unittest.TestCase):
 
     def test_no_drift_scenario(self):
         """Test scenario with no documentation drift."""
-        # Document the flag in README with backticks
-        self.readme_path.write_text('# Test\n\nUsage: `--new-flag`\n')
-        
-        # Document harness.py in AGENT_GUIDE
-        self.agent_guide_path.write_text('# Guide\n\n- **`harness.py`**: CLI entry\n')
-
-        has_drift, drift_items, store = doc_check.check_drift_before_finish(self.test_dir_path)
+        # Document the flag in README and harness.py in AGENT_GUIDE, passing the
+        # contents directly instead of rewriting the files on disk
+        has_drift, drift_items, store = doc_check.check_drift_before_finish(
+            self.test_dir_path,
+            files={
+                'README.md': '# Test\n\nUsage: `--new-flag`\n',
+                'AGENT_GUIDE.md': '# Guide\n\n- **`harness.py`**: CLI entry\n',
+                'harness.py': 'parser.add_argument("--new-flag")',
+            },
+        )
 
         # Should not detect any drift now
         self.assertEqual(len(drift_items), 0)
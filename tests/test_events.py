@@ -0,0 +1,247 @@
+import gc
+import unittest
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from pyfakefs import fake_filesystem_unittest
+
+import events
+from events import Event, EventLogger, get_session_events, read_events
+
+# (method, args, kwargs, expected event type, check on event data)
+_LOGGER_CASES = [
+    ("log_session_start", ("observer",), {}, "SESSION_STARTED",
+     lambda d: d["mode"] == "observer" and d["sessionId"] == "session-1"),
+    ("log_session_end", (), {}, "SESSION_ENDED", lambda d: d == {}),
+    ("log_lock_acquired", (), {}, "LOCK_ACQUIRED", lambda d: d["sessionId"] == "session-1"),
+    ("log_lock_denied", (), {"controller_pid": 12345}, "LOCK_DENIED",
+     lambda d: d["controllerPid"] == 12345),
+    ("log_lock_released", (), {}, "LOCK_RELEASED", lambda d: d == {}),
+    ("log_lock_stale_takeover", ("PID_DEAD",), {}, "LOCK_STALE_TAKEOVER",
+     lambda d: d["reason"] == "PID_DEAD"),
+    ("log_reconcile_start", (), {}, "RECONCILE_START", lambda d: d == {}),
+    ("log_reconcile_result", ({"projectsAdded": 1},), {}, "RECONCILE_RESULT",
+     lambda d: d == {"projectsAdded": 1}),
+    ("log_command_plan", ("finish", {"steps": 2}), {}, "COMMAND_PLAN",
+     lambda d: d == {"command": "finish", "plan": {"steps": 2}}),
+    ("log_command_execute", ("finish",), {}, "COMMAND_EXECUTE", lambda d: d["command"] == "finish"),
+    ("log_command_verify_ok", ("finish",), {}, "COMMAND_VERIFY_OK", lambda d: d["command"] == "finish"),
+    ("log_command_verify_fail", ("finish", "boom"), {}, "COMMAND_VERIFY_FAIL",
+     lambda d: d == {"command": "finish", "error": "boom"}),
+    ("log_state_updated", ({"focusProjectId": "proj-1"},), {}, "STATE_UPDATED",
+     lambda d: d == {"focusProjectId": "proj-1"}),
+]
+
+
+class TestEvent(unittest.TestCase):
+    """Test Event dataclass."""
+
+    def test_event_to_json_line(self):
+        """Test serializing an event to a single JSON line."""
+        event = Event(
+            timestamp="2025-01-01T00:00:00Z",
+            type="SESSION_STARTED",
+            sessionId="test-session",
+            data={"mode": "controller"},
+        )
+        line = event.to_json_line()
+
+        self.assertNotIn("\n", line)
+        self.assertEqual(json.loads(line), {
+            "timestamp": "2025-01-01T00:00:00Z",
+            "type": "SESSION_STARTED",
+            "sessionId": "test-session",
+            "data": {"mode": "controller"},
+        })
+
+
+class TestEventLogger(fake_filesystem_unittest.TestCase):
+    """Test EventLogger convenience methods."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.setUpPyfakefs()
+        self.log_path = Path("/fake/commander/events.log")
+        self.log_path.parent.mkdir(parents=True)
+        self.logger = EventLogger(self.log_path, session_id="session-1")
+        self.addCleanup(self.logger.close)
+
+    def test_log_event_accepts_string_type(self):
+        """Test logging an event with a plain string type."""
+        self.logger.log_event("CUSTOM", {"key": "value"})
+
+        [event] = read_events(self.log_path)
+        self.assertEqual(event.type, "CUSTOM")
+        self.assertEqual(event.sessionId, "session-1")
+        self.assertTrue(event.timestamp.endswith("Z"))
+
+    def test_events_visible_before_close_and_appended_after(self):
+        """Test that each event is flushed and close() does not lose the log."""
+        self.logger.log_session_start()
+        self.assertEqual(len(read_events(self.log_path)), 1)
+
+        self.logger.close()
+        self.logger.log_session_end()
+
+        self.assertEqual(
+            [e.type for e in read_events(self.log_path)],
+            ["SESSION_STARTED", "SESSION_ENDED"],
+        )
+
+    def test_non_ascii_data_is_written_as_utf8(self):
+        """Test that non-ASCII event data round-trips through a UTF-8 log."""
+        self.logger.log_event("CUSTOM", {"text": "café ✓"})
+
+        # Raises if the file is not valid UTF-8
+        line = self.log_path.read_bytes().decode("utf-8")
+        self.assertEqual(json.loads(line)["data"], {"text": "café ✓"})
+        [event] = read_events(self.log_path)
+        self.assertEqual(event.data, {"text": "café ✓"})
+
+    def test_open_handle_is_closed_when_logger_is_collected(self):
+        """Test that the kept-open handle is finalized without the logger being kept alive."""
+        logger = EventLogger(self.log_path, session_id="session-2")
+        logger.log_session_start()
+        fh, finalizer = logger._fh, logger._finalizer
+        self.assertTrue(finalizer.alive)
+
+        del logger
+        gc.collect()
+
+        self.assertFalse(finalizer.alive)
+        self.assertTrue(fh.closed)
+
+    def test_close_runs_finalizer(self):
+        """Test that close() closes the handle and retires its finalizer."""
+        self.logger.log_session_start()
+        fh, finalizer = self.logger._fh, self.logger._finalizer
+
+        self.logger.close()
+
+        self.assertTrue(fh.closed)
+        self.assertFalse(finalizer.alive)
+
+    def test_rotated_log_is_reopened(self):
+        """Test that events go to a new file once the log path is rotated or removed."""
+        self.logger.log_session_start()
+        rotated = self.log_path.with_name("events.log.1")
+        self.log_path.rename(rotated)
+
+        self.logger.log_lock_acquired()
+        self.assertEqual([e.type for e in read_events(rotated)], ["SESSION_STARTED"])
+        self.assertEqual([e.type for e in read_events(self.log_path)], ["LOCK_ACQUIRED"])
+
+        rotated.unlink()
+        self.log_path.rename(rotated)
+        self.log_path.write_text("")
+        self.logger.log_lock_released()
+        self.assertEqual([e.type for e in read_events(self.log_path)], ["LOCK_RELEASED"])
+
+    def test_convenience_methods(self):
+        """Test each log_* helper writes the expected event type and data."""
+        for name, args, kwargs, _, _ in _LOGGER_CASES:
+            getattr(self.logger, name)(*args, **kwargs)
+
+        logged = read_events(self.log_path)
+
+        self.assertEqual(len(logged), len(_LOGGER_CASES))
+        for event, (name, _, _, expected_type, check) in zip(logged, _LOGGER_CASES):
+            with self.subTest(method=name):
+                self.assertEqual(event.type, expected_type)
+                self.assertTrue(check(event.data), event.data)
+
+
+class TestReadEvents(fake_filesystem_unittest.TestCase):
+    """Test reading the append-only event log."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.setUpPyfakefs()
+        self.log_dir = Path("/fake/commander")
+        self.log_dir.mkdir(parents=True)
+        self.log_path = self.log_dir / "events.log"
+
+    def test_read_events_missing_file(self):
+        """Test that a missing log reads as no events."""
+        self.assertEqual(read_events(self.log_path), [])
+
+    def test_read_events_with_limit(self):
+        """Test that limit returns the most recent events."""
+        lines = [
+            Event(
+                timestamp="2025-01-01T00:00:00Z",
+                type=f"EVENT_{i}",
+                sessionId="fixed",
+                data={},
+            ).to_json_line()
+            for i in range(10)
+        ]
+        self.log_path.write_text("\n".join(lines) + "\n")
+
+        recent = read_events(self.log_path, limit=5)
+
+        self.assertEqual([e.type for e in recent], [f"EVENT_{i}" for i in range(5, 10)])
+
+    def test_json_backends_interoperate(self):
+        """Test that lines written by either JSON backend read back the same."""
+        event = Event(
+            timestamp="2025-01-01T00:00:00Z",
+            type="EVENT_OK",
+            sessionId="fixed",
+            data={"nested": {"n": 1}},
+        )
+        fast_line = event.to_json_line()
+        with patch.object(events, "ORJSON_AVAILABLE", False):
+            stdlib_line = event.to_json_line()
+        self.log_path.write_text(f"{fast_line}\n{stdlib_line}\n")
+
+        for use_orjson in (events.ORJSON_AVAILABLE, False):
+            with self.subTest(orjson=use_orjson), \
+                    patch.object(events, "ORJSON_AVAILABLE", use_orjson):
+                self.assertEqual(read_events(self.log_path), [event, event])
+
+    def test_read_events_skips_malformed_lines(self):
+        """Test that malformed and blank lines are skipped."""
+        good = Event(
+            timestamp="2025-01-01T00:00:00Z",
+            type="EVENT_OK",
+            sessionId="fixed",
+            data={},
+        ).to_json_line()
+        self.log_path.write_text(f"{good}\nnot json\n\n{{\"type\": \"partial\"}}\n")
+
+        with self.assertLogs(events.logger, level="WARNING"):
+            result = read_events(self.log_path)
+
+        self.assertEqual([e.type for e in result], ["EVENT_OK"])
+
+
+class TestGetSessionEvents(fake_filesystem_unittest.TestCase):
+    """Test filtering the event log by session."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.setUpPyfakefs()
+        self.log_path = Path("/fake/commander/events.log")
+        self.log_path.parent.mkdir(parents=True)
+        with EventLogger(self.log_path, session_id="sess-1") as first, \
+                EventLogger(self.log_path, session_id="sess-2") as second:
+            first.log_session_start()
+            second.log_session_start("observer")
+            first.log_session_end()
+
+    def test_get_session_events(self):
+        """Test that only the requested session's events are returned."""
+        result = get_session_events("sess-1", self.log_path)
+
+        self.assertEqual([e.type for e in result], ["SESSION_STARTED", "SESSION_ENDED"])
+        self.assertTrue(all(e.sessionId == "sess-1" for e in result))
+
+    def test_get_session_events_unknown_session(self):
+        """Test that an unknown session has no events."""
+        self.assertEqual(get_session_events("sess-3", self.log_path), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import os
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from pyfakefs import fake_filesystem_unittest
+
+import locking
+from locking import HEARTBEAT_TIMEOUT, HeartbeatInfo, LockInfo, LockManager
+
+_FROZEN_NOW = datetime(2025, 1, 1, 12, 0, 0)
+_MY_PID = os.getpid()
+# Above Linux's maximum pid_max (2**22), so no process can hold it
+_UNUSED_PID = 2 ** 22 + 1
+
+
+class TestHeartbeatStaleness(unittest.TestCase):
+    """Test heartbeat staleness against a frozen clock."""
+
+    def setUp(self):
+        self.lock_mgr = LockManager(
+            lock_path=Path("/nonexistent/commander.lock"),
+            heartbeat_path=Path("/nonexistent/commander.heartbeat"),
+        )
+        patcher = patch("locking._now", return_value=_FROZEN_NOW)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _heartbeat(self, age: timedelta) -> HeartbeatInfo:
+        return HeartbeatInfo(
+            sessionId="session-1",
+            lastBeatAt=(_FROZEN_NOW - age).isoformat() + "Z",
+        )
+
+    def test_fresh_heartbeat(self):
+        """Test that a heartbeat within the timeout is fresh."""
+        heartbeat = self._heartbeat(HEARTBEAT_TIMEOUT - timedelta(seconds=1))
+        self.assertFalse(self.lock_mgr.is_heartbeat_stale(heartbeat))
+
+    def test_stale_heartbeat(self):
+        """Test that a heartbeat older than the timeout is stale."""
+        heartbeat = self._heartbeat(HEARTBEAT_TIMEOUT + timedelta(minutes=1))
+        self.assertTrue(self.lock_mgr.is_heartbeat_stale(heartbeat))
+
+    def test_unparseable_heartbeat_is_stale(self):
+        """Test that a heartbeat with a bad timestamp is treated as stale."""
+        heartbeat = HeartbeatInfo(sessionId="session-1", lastBeatAt="not-a-time")
+        with self.assertLogs(locking.logger, level="ERROR"):
+            self.assertTrue(self.lock_mgr.is_heartbeat_stale(heartbeat))
+
+
+class TestStatelessChecks(unittest.TestCase):
+    """Test LockManager checks that need no lock or heartbeat on disk."""
+
+    def setUp(self):
+        self.lock_mgr = LockManager(
+            lock_path=Path("/nonexistent/commander.lock"),
+            heartbeat_path=Path("/nonexistent/commander.heartbeat"),
+        )
+
+    def test_check_pid_alive(self):
+        """Test liveness for the current process and an unused PID."""
+        for pid, expected in ((_MY_PID, True), (_UNUSED_PID, False)):
+            with self.subTest(pid=pid):
+                self.assertEqual(self.lock_mgr.check_pid_alive(pid), expected)
+
+    def test_readers_return_none_when_missing(self):
+        """Test that missing lock and heartbeat files read as None."""
+        for name, read in (
+            ("lock", self.lock_mgr.read_lock_info),
+            ("heartbeat", self.lock_mgr.read_heartbeat_info),
+        ):
+            with self.subTest(name=name):
+                self.assertIsNone(read())
+
+
+class TestLockTakeover(fake_filesystem_unittest.TestCase):
+    """Test lock acquisition decisions with a stubbed liveness check."""
+
+    def setUp(self):
+        self.setUpPyfakefs()
+        locks_dir = Path("/fake/locks")
+        locks_dir.mkdir(parents=True)
+        self.lock_mgr = LockManager(
+            lock_path=locks_dir / "commander.lock",
+            heartbeat_path=locks_dir / "commander.heartbeat",
+        )
+        # Don't leave atexit release hooks behind from test managers
+        patcher = patch("locking.atexit.register")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.lock_mgr.write_lock(LockInfo(pid=424242, startTime="2025-01-01T00:00:00Z", sessionId="other"))
+        self.lock_mgr.write_heartbeat(HeartbeatInfo(sessionId="other", lastBeatAt=locking._now().isoformat() + "Z"))
+
+    def test_dead_pid_is_taken_over(self):
+        """Test that a lock held by a dead PID is taken over."""
+        with patch("locking._pid_is_alive", return_value=False):
+            self.assertEqual(self.lock_mgr.acquire_lock(), (True, "STALE_TAKEOVER_PID_DEAD"))
+        self.assertTrue(self.lock_mgr.is_controller())
+
+    def test_live_pid_with_fresh_heartbeat_is_denied(self):
+        """Test that a live holder with a fresh heartbeat keeps the lock."""
+        with patch("locking._pid_is_alive", return_value=True):
+            self.assertEqual(self.lock_mgr.acquire_lock(), (False, "LOCK_DENIED"))
+
+    def test_update_heartbeat_advances_timestamp(self):
+        """Test that update_heartbeat rewrites lastBeatAt from the clock seam."""
+        later = _FROZEN_NOW + timedelta(seconds=60)
+        with patch("locking._pid_is_alive", return_value=False), \
+                patch("locking._now", return_value=_FROZEN_NOW):
+            self.lock_mgr.acquire_lock()
+        with patch("locking._now", return_value=later):
+            self.lock_mgr.update_heartbeat()
+
+        heartbeat = self.lock_mgr.read_heartbeat_info()
+        self.assertEqual(heartbeat.sessionId, self.lock_mgr.sessionId)
+        self.assertEqual(heartbeat.lastBeatAt, later.isoformat() + "Z")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,40 +8,43 @@ from unittest.mock import patch
 # Configure lifecycle module to use temporary directories
 import lifecycle
 
+from tests._gitutil import GIT, GIT_TIMEOUT, branch_exists, init_repo
+
+
 class TestOrchestrator(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Build the target repo with its initial commit once; each test gets a copy
+        cls.seed_root = tempfile.TemporaryDirectory()
+        cls.seed_target_path = Path(cls.seed_root.name) / "my-project"
+        cls.seed_target_path.mkdir()
+        init_repo(cls.seed_target_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.seed_root.cleanup()
+
     def setUp(self):
-        # 1. Create a "Harness" environment (temp dir simulating where we run the tool)
-        self.harness_root = tempfile.TemporaryDirectory()
-        self.harness_path = Path(self.harness_root.name)
+        # One temp root per test holds both sibling trees below
+        self.test_root = tempfile.TemporaryDirectory()
+        root_path = Path(self.test_root.name)
+
+        # 1. Create a "Harness" environment (dir simulating where we run the tool)
+        self.harness_path = root_path / "harness"
+        self.harness_path.mkdir()
         
         # 2. Patch RUNS_DIR to be inside our Harness test env
         self.runs_dir = self.harness_path / "runs"
-        self.runs_patcher = patch('lifecycle.RUNS_DIR', self.runs_dir)
+        self.runs_patcher = patch.object(lifecycle, 'RUNS_DIR', self.runs_dir)
         self.runs_patcher.start()
         
-        # 3. Create a "Target Repo" (external to Harness)
-        self.target_root = tempfile.TemporaryDirectory()
-        self.target_path = Path(self.target_root.name) / "my-project"
-        self.target_path.mkdir()
-        
-        # Initialize target repo
-        run_git_target = lambda args: subprocess.run(
-            ["git"] + args, cwd=self.target_path, check=True, capture_output=True
-        )
-        run_git_target(["init"])
-        run_git_target(["config", "user.email", "test@example.com"])
-        run_git_target(["config", "user.name", "Test User"])
-        run_git_target(["checkout", "-B", "main"])
-        
-        # Initial commit
-        (self.target_path / "README.md").write_text("# Target Repo")
-        run_git_target(["add", "README.md"])
-        run_git_target(["commit", "-m", "Initial commit"])
+        # 3. Copy the seeded "Target Repo" (external to Harness)
+        self.target_path = root_path / "my-project"
+        shutil.copytree(self.seed_target_path, self.target_path, symlinks=True)
 
     def tearDown(self):
         self.runs_patcher.stop()
-        self.harness_root.cleanup()
-        self.target_root.cleanup()
+        self.test_root.cleanup()
 
     def test_external_repo_workflow(self):
         """Test the full Orchestrator workflow."""
@@ -60,20 +63,18 @@ class TestOrchestrator(unittest.TestCase):
         
         # VERIFY: Git status in worktree
         # It should know it's part of the target repo
-        status = subprocess.check_output(["git", "status"], cwd=run_dir, text=True)
+        status = subprocess.check_output([GIT, "status"], cwd=run_dir, text=True, timeout=GIT_TIMEOUT)
         self.assertIn(f"On branch run/{run_name}", status)
         
         # VERIFY: Branch existence in target repo
-        branches = subprocess.check_output(["git", "branch"], cwd=self.target_path, text=True)
-        self.assertIn(f"run/{run_name}", branches)
+        self.assertTrue(branch_exists(self.target_path, f"run/{run_name}"))
         
         # 2. Cleanup
         lifecycle.cleanup_run(run_name, delete_branch=True)
         
         # VERIFY: Cleanup
         self.assertFalse(run_dir.exists())
-        branches_after = subprocess.check_output(["git", "branch"], cwd=self.target_path, text=True)
-        self.assertNotIn(f"run/{run_name}", branches_after)
+        self.assertFalse(branch_exists(self.target_path, f"run/{run_name}"))
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,303 @@
+import json
+import os
+import subprocess
+import unittest
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from pyfakefs import fake_filesystem_unittest
+
+from reconcile import GitStatus, HarnessRunInfo, Reconciler, cached
+from state import Run, State
+
+# `git worktree list --porcelain` bytes: bare main, a branch, and a locked detached HEAD
+_WORKTREE_OUTPUT = (
+    b"worktree /repo\nbare\n\n"
+    b"worktree /runs/a\nHEAD abc123\nbranch refs/heads/run/a\n\n"
+    b"worktree /runs/b\nHEAD def456\ndetached\nlocked\n"
+)
+
+
+def _write_json(path: Path, obj) -> None:
+    """Write a compact JSON fixture with a single os.write."""
+    fd = os.open(os.fspath(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, json.dumps(obj, separators=(",", ":")).encode())
+    finally:
+        os.close(fd)
+
+
+def _mkrun(path: Path, marker: bool = True) -> Path:
+    """Create a run directory, optionally with its .harness-worktree marker."""
+    os.makedirs(path)
+    if marker:
+        os.close(os.open(os.path.join(path, ".harness-worktree"), os.O_WRONLY | os.O_CREAT, 0o644))
+    return path
+
+
+class TestReconcileState(unittest.TestCase):
+    """Test in-memory reconciliation of State against harness runs."""
+
+    def setUp(self):
+        self.reconciler = Reconciler(harness_path=Path("/nonexistent/harness"))
+
+    def test_reconcile_parks_missing_run(self):
+        """Test that a run missing from the harness is parked in place."""
+        run = Run(id="run-1", projectId="proj-1", runName="gone", state="running")
+        state = State(runs=[run])
+
+        result = self.reconciler.reconcile_state(state, harness_runs=[])
+
+        self.assertTrue(result.drift_detected)
+        self.assertEqual(result.runs_parked, 1)
+        self.assertEqual(run.state, "missing")
+
+    def test_reconcile_counts_discovered_run(self):
+        """Test that a harness run unknown to state is counted as added."""
+        harness_run = HarnessRunInfo(name="new", branch="run/new", status="active", worktree_path=None)
+
+        result = self.reconciler.reconcile_state(State(), harness_runs=[harness_run])
+
+        self.assertTrue(result.drift_detected)
+        self.assertEqual(result.runs_added, 1)
+
+    def test_reconcile_in_sync_has_no_drift(self):
+        """Test that matching state and harness runs report no drift."""
+        run = Run(id="run-1", projectId="proj-1", runName="same", state="running")
+        harness_run = HarnessRunInfo(name="same", branch="run/same", status="active", worktree_path=None)
+
+        result = self.reconciler.reconcile_state(State(runs=[run]), harness_runs=[harness_run])
+
+        self.assertFalse(result.drift_detected)
+        self.assertEqual(run.state, "running")
+
+
+class _Counter:
+    """Minimal host for the cached decorator."""
+
+    def __init__(self):
+        self.calls = 0
+
+    @cached(cache_duration=timedelta(seconds=30))
+    def compute(self, value):
+        self.calls += 1
+        return value * 2
+
+
+class TestCachedDecorator(unittest.TestCase):
+    """Test the per-instance result cache."""
+
+    def test_cached_returns_same_result_within_duration(self):
+        """Test that repeat calls within the duration hit the instance cache."""
+        counter = _Counter()
+
+        self.assertEqual(counter.compute(2), 4)
+        self.assertEqual(counter.compute(2), 4)
+
+        self.assertEqual(counter.calls, 1)
+        self.assertIn("_cache_compute", vars(counter))
+
+    def test_cache_is_per_instance_and_per_args(self):
+        """Test that other instances and other arguments miss the cache."""
+        first, second = _Counter(), _Counter()
+
+        first.compute(2)
+        first.compute(3)
+        second.compute(2)
+
+        self.assertEqual((first.calls, second.calls), (2, 1))
+
+    def test_cache_expires_and_clears(self):
+        """Test expiry on the monotonic clock and explicit clearing."""
+        counter = _Counter()
+        with patch("reconcile.time.monotonic_ns", return_value=0):
+            counter.compute(2)
+        with patch("reconcile.time.monotonic_ns", return_value=30 * 10**9):
+            counter.compute(2)
+        self.assertEqual(counter.calls, 2)
+
+        _Counter.compute.clear_cache(counter)
+        counter.compute(2)
+        self.assertEqual(counter.calls, 3)
+
+
+class TestReconcilerGit(unittest.TestCase):
+    """Test git wrappers against a stubbed subprocess.run."""
+
+    def setUp(self):
+        self.reconciler = Reconciler(harness_path=Path("/nonexistent/harness"))
+        patcher = patch("reconcile.subprocess.run")
+        self.mock_run = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _stdout(self, *outputs: bytes):
+        self.mock_run.side_effect = [
+            subprocess.CompletedProcess(args=[], returncode=0, stdout=out, stderr=b"")
+            for out in outputs
+        ]
+
+    def test_run_git_successful(self):
+        """Test that stdout is decoded and stripped."""
+        self._stdout(b"main\n")
+
+        self.assertEqual(self.reconciler.run_git(["rev-parse", "HEAD"]), "main")
+        self.assertEqual(self.mock_run.call_args.args[0], ["git", "rev-parse", "HEAD"])
+        self.assertEqual(self.mock_run.call_args.kwargs["cwd"], Path("/nonexistent/harness"))
+
+    def test_run_git_fails_on_error(self):
+        """Test that a failing git command raises RuntimeError with stderr."""
+        self.mock_run.side_effect = subprocess.CalledProcessError(128, ["git"], stderr=b"fatal: nope")
+
+        with self.assertRaisesRegex(RuntimeError, "fatal: nope"):
+            self.reconciler.run_git(["status"])
+
+    def test_get_git_status(self):
+        """Test branch and changed-file count from porcelain v2 output."""
+        self._stdout(b"run/feature\n", b"1 .M N... 100644 100644 100644 a b file1.py\n? new.txt\n")
+
+        status = self.reconciler.get_git_status(Path("/repo"))
+
+        self.assertEqual(status.branch, "run/feature")
+        self.assertFalse(status.clean)
+        self.assertEqual(status.files_changed, 2)
+
+    def test_list_worktrees(self):
+        """Test parsing porcelain worktree records, including bare and detached."""
+        self._stdout(_WORKTREE_OUTPUT)
+
+        worktrees = self.reconciler.list_worktrees()
+
+        self.assertEqual(
+            [(w.path, w.branch, w.is_bare) for w in worktrees],
+            [("/repo", "", True), ("/runs/a", "run/a", False), ("/runs/b", "", False)],
+        )
+
+
+class TestDirtyTreePolicy(unittest.TestCase):
+    """Test check_dirty_tree_policy against a rebound get_git_status."""
+
+    def setUp(self):
+        self.reconciler = Reconciler(harness_path=Path("/nonexistent/harness"))
+
+    def _status(self, files_changed: int) -> None:
+        # Per-test instance, so a plain rebind needs no patch or cleanup
+        status = GitStatus(branch="main", clean=files_changed == 0, files_changed=files_changed)
+        self.reconciler.get_git_status = lambda repo_path: status
+
+    def test_check_dirty_tree_policy_clean(self):
+        """Test that a clean tree passes."""
+        self._status(0)
+        self.assertEqual(self.reconciler.check_dirty_tree_policy(Path("/repo")), (True, "Working tree is clean"))
+
+    def test_check_dirty_tree_policy_dirty(self):
+        """Test that a dirty tree fails, and says so when mutations are refused."""
+        self._status(3)
+
+        self.assertEqual(
+            self.reconciler.check_dirty_tree_policy(Path("/repo")),
+            (False, "Working tree is dirty (3 files changed)"),
+        )
+        self.assertEqual(
+            self.reconciler.check_dirty_tree_policy(Path("/repo"), allow_mutations=False),
+            (False, "Working tree is dirty (3 files changed). Mutations refused."),
+        )
+
+    def test_check_dirty_tree_policy_git_error(self):
+        """Test that a git failure is reported as not clean."""
+        def fail(repo_path):
+            raise RuntimeError("not a git repository")
+        self.reconciler.get_git_status = fail
+
+        is_clean, message = self.reconciler.check_dirty_tree_policy(Path("/repo"))
+
+        self.assertFalse(is_clean)
+        self.assertIn("not a git repository", message)
+
+
+class TestWorktreePathSafety(fake_filesystem_unittest.TestCase):
+    """Test worktree deletion safety checks against an injected runs dir."""
+
+    def setUp(self):
+        self.setUpPyfakefs()
+        self.harness_path = Path("/fake/harness")
+        self.runs_dir = Path("/fake/shared-runs")
+        self.reconciler = Reconciler(harness_path=self.harness_path, runs_dir=self.runs_dir)
+
+    def test_runs_dir_defaults_under_harness_path(self):
+        """Test that runs_dir falls back to harness_path / 'runs'."""
+        self.assertEqual(Reconciler(harness_path=self.harness_path).runs_dir, self.harness_path / "runs")
+
+    def test_worktree_under_injected_runs_dir_is_safe(self):
+        """Test that a marked worktree under runs_dir may be deleted."""
+        worktree = _mkrun(self.runs_dir / "run-1")
+        self.assertEqual(self.reconciler.validate_worktree_path(worktree, []), (True, "Path is safe"))
+
+    def test_worktree_outside_runs_dir_is_refused(self):
+        """Test that a marked worktree outside runs_dir and projects is refused."""
+        worktree = _mkrun(self.harness_path / "runs" / "run-1")
+        is_safe, message = self.reconciler.validate_worktree_path(worktree, [])
+        self.assertFalse(is_safe)
+        self.assertIn("not under registered project", message)
+
+    def test_worktree_without_marker_is_refused(self):
+        """Test that a worktree without the marker file is refused."""
+        worktree = _mkrun(self.runs_dir / "run-2", marker=False)
+        is_safe, message = self.reconciler.validate_worktree_path(worktree, [])
+        self.assertFalse(is_safe)
+        self.assertIn(".harness-worktree", message)
+
+
+class TestListHarnessRuns(fake_filesystem_unittest.TestCase):
+    """Test discovery of runs from .run metadata under runs_dir."""
+
+    def setUp(self):
+        self.setUpPyfakefs()
+        self.runs_dir = Path("/fake/harness/runs")
+        self.runs_dir.mkdir(parents=True)
+        self.reconciler = Reconciler(harness_path=Path("/fake/harness"), runs_dir=self.runs_dir)
+
+    def test_list_harness_runs_discovers_run_with_metadata(self):
+        """Test that only directories with .run metadata are reported."""
+        run_dir = self.runs_dir / "feature"
+        run_dir.mkdir()
+        _write_json(run_dir / ".run", {"branch": "run/feature", "status": "active"})
+        (self.runs_dir / "no-metadata").mkdir()
+        (self.runs_dir / "stray.txt").write_text("not a run")
+
+        self.assertEqual(self.reconciler.list_harness_runs(), [
+            HarnessRunInfo(
+                name="feature", branch="run/feature", status="active", worktree_path=str(run_dir),
+            ),
+        ])
+
+    def test_metadata_cache_tracks_file_changes(self):
+        """Test that unchanged .run files are not re-read and changed ones are."""
+        metadata = self.runs_dir / "feature" / ".run"
+        metadata.parent.mkdir()
+        _write_json(metadata, {"branch": "run/feature", "status": "active"})
+        self.assertEqual(self.reconciler.list_harness_runs()[0].status, "active")
+
+        with patch("reconcile.json.load") as mock_load:
+            self.assertEqual(self.reconciler.list_harness_runs()[0].status, "active")
+        mock_load.assert_not_called()
+
+        # Same size, new mtime
+        _write_json(metadata, {"branch": "run/feature", "status": "frozen"})
+        os.utime(metadata, ns=(0, metadata.stat().st_mtime_ns + 1))
+        self.assertEqual(self.reconciler.list_harness_runs()[0].status, "frozen")
+
+        # New size, mtime forced back to the cached value
+        mtime_ns = metadata.stat().st_mtime_ns
+        _write_json(metadata, {"branch": "run/feature", "status": "finished"})
+        os.utime(metadata, ns=(0, mtime_ns))
+        self.assertEqual(self.reconciler.list_harness_runs()[0].status, "finished")
+
+    def test_missing_runs_dir_lists_nothing(self):
+        """Test that an absent runs_dir yields no runs."""
+        self.runs_dir.rmdir()
+        self.assertEqual(self.reconciler.list_harness_runs(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
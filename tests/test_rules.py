@@ -0,0 +1,87 @@
+import unittest
+
+from rules import compute_next_action
+from state import InboxItem, Project, Run, State, Task
+
+_CREATED_AT = "2025-01-01T00:00:00Z"
+
+
+class MockStateManager:
+    """Stand-in for StateManager that only answers project lookups."""
+
+    def __init__(self, projects=None):
+        self._by_id = {p.id: p for p in (projects or [])}
+
+    def get_project(self, project_id):
+        return self._by_id.get(project_id)
+
+
+def _task(column: str) -> Task:
+    return Task(id="task-1", projectId="proj-1", title="Write docs", column=column, createdAt=_CREATED_AT)
+
+
+class TestComputeNextAction(unittest.TestCase):
+    """Test rule priority in compute_next_action."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.project = Project(id="proj-1", name="test-project", repoPath="/tmp/test", status="active")
+        cls.state_mgr = MockStateManager(projects=[cls.project])
+
+    def test_rules(self):
+        """Test that each rule fires for its state and outranks later rules."""
+        project = self.project
+        cases = [
+            ("rule1_clean_finished_run",
+             lambda: State(focusProjectId="proj-1", projects=[project], tasks=[_task("doing")],
+                           runs=[Run(id="run-1", projectId="proj-1", runName="done-run", state="finished")]),
+             "c-harness clean done-run"),
+            ("rule2_set_focus",
+             lambda: State(projects=[project], tasks=[_task("doing")]),
+             "c-harness focus set"),
+            ("rule2_first_run",
+             lambda: State(),
+             "c-harness start <run-name>"),
+            ("rule3_continue_doing",
+             lambda: State(focusProjectId="proj-1", projects=[project], tasks=[_task("todo"), _task("preview")]),
+             "# Work on task: Write docs"),
+            ("rule4_start_todo",
+             lambda: State(focusProjectId="proj-1", projects=[project], tasks=[_task("todo")],
+                           inbox=[InboxItem(id="inbox-1", text="idea", createdAt=_CREATED_AT)]),
+             "c-harness focus set <project>; c-harness start <run-name>"),
+            ("rule5_promote_inbox",
+             lambda: State(focusProjectId="proj-1", projects=[project],
+                           inbox=[InboxItem(id="inbox-123456789", text="idea", createdAt=_CREATED_AT)]),
+             "c-harness inbox promote inbox-12"),
+            ("rule6_start_new_run",
+             lambda: State(focusProjectId="proj-1", projects=[project]),
+             "--project test-project"),
+        ]
+        for name, build_state, expected in cases:
+            with self.subTest(name=name):
+                result = compute_next_action(build_state(), self.state_mgr)
+                self.assertIn(expected, result["action"])
+                self.assertEqual(set(result), {"action", "why", "done"})
+
+    def test_unknown_project_names_fall_back(self):
+        """Test that runs and focus pointing at missing projects report 'unknown'."""
+        finished = State(runs=[Run(id="run-1", projectId="gone", runName="r", state="finished")])
+        idle = State(focusProjectId="gone", projects=[self.project])
+
+        self.assertIn("unknown", compute_next_action(finished, self.state_mgr)["why"])
+        self.assertIn("--project unknown", compute_next_action(idle, self.state_mgr)["action"])
+
+    def test_idempotent(self):
+        """Test that compute_next_action is pure: same input, same output, no mutation."""
+        state = State(focusProjectId="proj-1", projects=[self.project], tasks=[_task("todo")])
+        before = state.to_dict()
+
+        first = compute_next_action(state, self.state_mgr)
+        second = compute_next_action(state, self.state_mgr)
+
+        self.assertEqual(first, second)
+        self.assertEqual(state.to_dict(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
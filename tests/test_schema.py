@@ -1,39 +1,62 @@
 import unittest
 import json
+import os
 import tempfile
-import shutil
 from pathlib import Path
+from unittest.mock import patch
 import schema
 
+
+def _fast_rmtree(path):
+    """Remove a small fixture tree; only safe because fixtures contain no symlinks."""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
 class TestSchema(unittest.TestCase):
+    # Fixtures serialized once at import; tests only write the bytes
+    _VALID_BLOB = json.dumps({
+        "meta": {"project": "test-proj"},
+        "tasks": [
+            {
+                "id": "1", "category": "api", "title": "T1", "description": "D1",
+                "acceptance_criteria": ["ac1"], "passes": False
+            },
+            {
+                "id": "2", "category": "api", "title": "T2", "description": "D2",
+                "acceptance_criteria": ["ac2"], "passes": False
+            },
+            {
+                "id": "3", "category": "api", "title": "T3", "description": "D3",
+                "acceptance_criteria": ["ac3"], "passes": True
+            }
+        ]
+    }).encode("utf-8")
+    # 'tasks' is missing
+    _MISSING_TASKS_BLOB = json.dumps({"meta": {"project": "test-proj"}}).encode("utf-8")
+
+    @classmethod
+    def setUpClass(cls):
+        # One tempdir for the class; each test works in its own subdirectory
+        cls.root_dir = tempfile.mkdtemp(prefix="harness-tests-")
+
+    @classmethod
+    def tearDownClass(cls):
+        _fast_rmtree(cls.root_dir)
+
     def setUp(self):
-        self.test_dir = tempfile.mkdtemp()
+        self.test_dir = os.path.join(self.root_dir, self._testMethodName)
+        os.mkdir(self.test_dir)
         self.handoff_path = Path(self.test_dir) / "handoff.json"
 
-    def tearDown(self):
-        shutil.rmtree(self.test_dir)
-
     def test_valid_handoff(self):
         """Test parsing a valid handoff.json file."""
-        data = {
-            "meta": {"project": "test-proj"},
-            "tasks": [
-                {
-                    "id": "1", "category": "api", "title": "T1", "description": "D1", 
-                    "acceptance_criteria": ["ac1"], "passes": False
-                },
-                {
-                    "id": "2", "category": "api", "title": "T2", "description": "D2", 
-                    "acceptance_criteria": ["ac2"], "passes": False
-                },
-                {
-                    "id": "3", "category": "api", "title": "T3", "description": "D3", 
-                    "acceptance_criteria": ["ac3"], "passes": True
-                }
-            ]
-        }
-        with open(self.handoff_path, "w") as f:
-            json.dump(data, f)
+        self.handoff_path.write_bytes(self._VALID_BLOB)
 
         handoff = schema.load_handoff(self.handoff_path)
         passing, total = handoff.count_passing()
@@ -51,18 +74,72 @@ class TestSchema(unittest.TestCase):
 
     def test_missing_tasks_field(self):
         """Test validation for missing required fields."""
-        data = {
-            "meta": {"project": "test-proj"},
-            # 'tasks' is missing
-        }
-        with open(self.handoff_path, "w") as f:
-            json.dump(data, f)
-            
+        self.handoff_path.write_bytes(self._MISSING_TASKS_BLOB)
+
         handoff = schema.load_handoff(self.handoff_path)
         # It should return empty tasks list, but validation should fail if we call validate()
         errors = handoff.validate()
         self.assertIn("Handoff has no tasks", errors)
 
+    @unittest.skipUnless(schema.IJSON_AVAILABLE, "ijson not installed")
+    def test_streamed_handoff_matches_json_load(self):
+        """Verify the ijson streaming path produces the same Handoff."""
+        data = {
+            "meta": {"project": "test-proj", "phase": "Phase 2"},
+            "tasks": [
+                {
+                    "id": str(i), "category": "api", "title": f"T{i}", "description": "D",
+                    "acceptance_criteria": ["ac"], "passes": i % 2 == 0
+                }
+                for i in range(5)
+            ]
+        }
+        with open(self.handoff_path, "w") as f:
+            json.dump(data, f)
+
+        expected = schema.load_handoff(self.handoff_path)
+        with patch.object(schema, "STREAM_THRESHOLD_BYTES", 0):
+            streamed = schema.load_handoff(self.handoff_path)
+
+        self.assertEqual(streamed.to_dict(), expected.to_dict())
+
+    @unittest.skipUnless(schema.IJSON_AVAILABLE, "ijson not installed")
+    def test_streamed_handoff_matches_json_load_on_edge_documents(self):
+        """Verify both paths agree on legacy, duplicate-key and non-object documents."""
+        task = {"id": "1", "category": "api", "title": "T", "description": "D", "acceptance_criteria": ["ac"]}
+        cases = [
+            ("legacy_array", json.dumps([{"description": "legacy task"}, {"id": "X"}])),
+            ("duplicate_keys", '{"meta": {"project": "a"}, "tasks": [%s, %s], "meta": {"project": "b"}, '
+                               '"tasks": [%s]}' % (json.dumps(task), json.dumps(task), json.dumps(task))),
+            ("string", '"str"'),
+            ("number", "5"),
+            ("null", "null"),
+        ]
+        for name, text in cases:
+            with self.subTest(name):
+                self.handoff_path.write_text(text)
+                try:
+                    expected = schema.load_handoff(self.handoff_path).to_dict()
+                except json.JSONDecodeError:
+                    expected = json.JSONDecodeError
+                with patch.object(schema, "STREAM_THRESHOLD_BYTES", 0):
+                    if expected is json.JSONDecodeError:
+                        with self.assertRaises(json.JSONDecodeError):
+                            schema.load_handoff(self.handoff_path)
+                    else:
+                        self.assertEqual(schema.load_handoff(self.handoff_path).to_dict(), expected)
+
+    def test_validate_fail_fast_stops_at_first_error(self):
+        """Verify fail_fast returns only the first error found."""
+        tasks = [
+            schema.Task(id="1", category="bogus", title="", description="", acceptance_criteria=[]),
+            schema.Task(id="1", category="api", title="t", description="d", acceptance_criteria=["ac"]),
+        ]
+        handoff = schema.Handoff(meta=schema.HandoffMeta(project="test"), tasks=tasks)
+
+        self.assertEqual(handoff.validate(fail_fast=True), ["Duplicate task IDs: {'1'}"])
+        self.assertGreater(len(handoff.validate()), 1)
+
     def test_task_count_logic(self):
         """Verify task counting logic directly."""
         # Create tasks manually
@@ -0,0 +1,284 @@
+import unittest
+import json
+import uuid
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from pyfakefs import fake_filesystem_unittest
+
+import state
+from state import InboxItem, Project, Run, State, StateManager, Task
+
+
+def _complex_state() -> State:
+    """A State with one item of every kind."""
+    return State(
+        focusProjectId="proj-1",
+        projects=[Project(id="proj-1", name="p", repoPath="/repo", status="active", lastTouchedAt="t")],
+        runs=[Run(id="run-1", projectId="proj-1", runName="r", state="running")],
+        tasks=[Task(id="task-1", projectId="proj-1", title="t", column="todo", createdAt="t")],
+        inbox=[InboxItem(id="inbox-1", text="idea", createdAt="t")],
+    )
+
+
+class TestStateModels(unittest.TestCase):
+    """Test State serialization helpers."""
+
+    def test_to_dict_matches_asdict_and_is_a_copy(self):
+        """Test that to_dict equals asdict() and does not alias the items."""
+        state = _complex_state()
+
+        data = state.to_dict()
+        self.assertEqual(data, asdict(state))
+        self.assertEqual(State.from_dict(data), state)
+
+        data["projects"][0]["name"] = "changed"
+        self.assertEqual(state.projects[0].name, "p")
+
+    def test_empty_id_is_generated(self):
+        """Test that every item kind fills in a unique id when given an empty one."""
+        cases = [
+            (InboxItem, {"text": "x", "createdAt": "t"}),
+            (Task, {"projectId": "p", "title": "t", "column": "todo", "createdAt": "t"}),
+            (Run, {"projectId": "p", "runName": "r", "state": "running"}),
+            (Project, {"name": "n", "repoPath": "/", "status": "active"}),
+        ]
+        for cls, kwargs in cases:
+            with self.subTest(cls=cls.__name__):
+                first, second = cls(id="", **kwargs), cls(id="", **kwargs)
+                self.assertTrue(first.id)
+                self.assertNotEqual(first.id, second.id)
+
+    def test_get_timestamp_matches_isoformat(self):
+        """Test that get_timestamp matches utcnow().isoformat() + 'Z', across seconds."""
+        base_ns = 1_735_689_600 * 10**9  # 2025-01-01T00:00:00Z
+        for delta_ns in (123_456_789, 999_999_999, 10**9, 10**9 + 500, 86_400 * 10**9 + 1_000):
+            ns = base_ns + delta_ns
+            expected = (datetime(1970, 1, 1) + timedelta(microseconds=ns // 1000)).isoformat() + "Z"
+            with self.subTest(ns=ns), patch("state.time.time_ns", return_value=ns):
+                timestamp = state.get_timestamp()
+                self.assertEqual(timestamp, expected)
+                self.assertEqual(datetime.fromisoformat(timestamp[:-1]).isoformat() + "Z", timestamp)
+
+    def test_generate_uuid_matches_uuid4_format(self):
+        """Test that generate_uuid yields the str(uuid4()) shape for the same random bytes."""
+        raw = bytes(range(16))
+        with patch("state.os.urandom", return_value=raw):
+            generated = state.generate_uuid()
+        self.assertEqual(generated, str(uuid.UUID(bytes=raw, version=4)))
+
+        random_id = state.generate_uuid()
+        parsed = uuid.UUID(random_id)
+        self.assertEqual((parsed.version, parsed.variant), (4, uuid.RFC_4122))
+        self.assertEqual(str(parsed), random_id)
+
+
+class TestStateManager(fake_filesystem_unittest.TestCase):
+    """Test StateManager persistence."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.setUpPyfakefs()
+        self.state_path = Path("/fake/commander/state.json")
+        self.state_path.parent.mkdir(parents=True)
+
+    def test_non_durable_write_skips_fsync(self):
+        """Test that durable=False writes atomically without fsync."""
+        mgr = StateManager(self.state_path, durable=False)
+
+        with patch.object(state, "_sync_data") as mock_sync:
+            mgr.atomic_write({"version": 1})
+
+        mock_sync.assert_not_called()
+        self.assertTrue(self.state_path.exists())
+        self.assertFalse(mgr.state_tmp_path.exists())
+
+    def test_durable_write_fsyncs(self):
+        """Test that durable=True syncs the temp file before the rename."""
+        mgr = StateManager(self.state_path, durable=True)
+
+        with patch.object(state, "_sync_data") as mock_sync:
+            mgr.atomic_write({"version": 1})
+
+        mock_sync.assert_called_once()
+        self.assertTrue(self.state_path.exists())
+
+    def test_load_state(self):
+        """Test loading corrupt, missing and valid state files."""
+        cases = [
+            ("corrupt", "{ invalid json }", None),
+            ("missing", None, None),
+            ("valid", json.dumps({"focusProjectId": "proj-1"}), "proj-1"),
+        ]
+        for name, content, focus in cases:
+            with self.subTest(name):
+                if content is None:
+                    self.state_path.unlink(missing_ok=True)
+                else:
+                    self.state_path.write_text(content)
+                mgr = StateManager(self.state_path)
+
+                if name == "corrupt":
+                    with self.assertLogs(state.logger, level="ERROR"), \
+                            self.assertRaisesRegex(ValueError, "repair-state"):
+                        mgr.load_state()
+                    continue
+
+                loaded = mgr.load_state()
+                self.assertEqual(loaded.focusProjectId, focus)
+                self.assertEqual(loaded.projects, [])
+
+    def test_reload_skips_parse_while_file_unchanged(self):
+        """Test that load_state reuses state, without re-encoding it, until the file changes."""
+        StateManager(self.state_path, durable=False).update_state(State(focusProjectId="proj-1"))
+        mgr = StateManager(self.state_path)
+        loaded = mgr.load_state()
+
+        with patch.object(state, "_encode_state") as mock_encode:
+            self.assertIs(mgr.load_state(), loaded)
+        mock_encode.assert_not_called()
+
+        self.state_path.write_text(json.dumps({"focusProjectId": "proj-22"}))
+        self.assertEqual(mgr.load_state().focusProjectId, "proj-22")
+
+    def test_reload_rereads_after_unwritten_save(self):
+        """Test that a save dropped by a failing batch makes load_state re-read the file."""
+        StateManager(self.state_path, durable=False).update_state(State(focusProjectId="proj-1"))
+        mgr = StateManager(self.state_path)
+        mgr.load_state()
+
+        with self.assertRaises(RuntimeError), mgr.batch():
+            mgr.state.focusProjectId = "half-applied"
+            mgr.save_state()
+            raise RuntimeError("boom")
+
+        self.assertEqual(mgr.load_state().focusProjectId, "proj-1")
+
+    def test_reload_after_save_reuses_saved_state(self):
+        """Test that a state just saved is not re-parsed on the next load."""
+        mgr = StateManager(self.state_path, durable=False)
+        mgr.load_state().focusProjectId = "proj-1"
+        mgr.save_state()
+
+        with patch.object(state.State, "from_dict") as mock_from_dict:
+            self.assertEqual(mgr.load_state().focusProjectId, "proj-1")
+        mock_from_dict.assert_not_called()
+
+    def test_save_state_writes_only_changed_payloads(self):
+        """Test save_state against a stubbed atomic_write: no disk I/O."""
+        mgr = StateManager(self.state_path)
+        mgr.load_state()
+
+        with patch.object(mgr, "atomic_write") as mock_write:
+            mgr.state.focusProjectId = "proj-123"
+            mgr.save_state()
+
+        mock_write.assert_called_once()
+        self.assertEqual(json.loads(mock_write.call_args.args[0])["focusProjectId"], "proj-123")
+        self.assertFalse(self.state_path.exists())
+
+    def test_save_state_skips_unchanged_state(self):
+        """Test that saving the state as loaded does not rewrite the file."""
+        StateManager(self.state_path, durable=False).update_state(State(focusProjectId="proj-1"))
+        mgr = StateManager(self.state_path)
+        mgr.load_state()
+
+        with patch.object(mgr, "atomic_write") as mock_write:
+            mgr.save_state()
+
+        mock_write.assert_not_called()
+
+    def test_batch_collapses_saves_into_one_write(self):
+        """Test that saves inside nested batch blocks are written once on exit."""
+        mgr = StateManager(self.state_path)
+        mgr.load_state()
+
+        with patch.object(mgr, "atomic_write") as mock_write:
+            with mgr.batch():
+                with mgr.batch():
+                    mgr.state.focusProjectId = "proj-1"
+                    mgr.save_state()
+                mgr.state.inbox.append(InboxItem(id="inbox-1", text="idea", createdAt="t"))
+                mgr.save_state()
+                mock_write.assert_not_called()
+
+        mock_write.assert_called_once()
+        saved = json.loads(mock_write.call_args.args[0])
+        self.assertEqual((saved["focusProjectId"], len(saved["inbox"])), ("proj-1", 1))
+
+    def test_batch_that_raises_does_not_save(self):
+        """Test that a failing batch block leaves the file untouched."""
+        StateManager(self.state_path, durable=False).update_state(State(focusProjectId="proj-1"))
+        before = self.state_path.read_bytes()
+        mgr = StateManager(self.state_path)
+        mgr.load_state()
+
+        with self.assertRaises(RuntimeError):
+            with mgr.batch():
+                mgr.state.focusProjectId = "half-applied"
+                mgr.save_state()
+                raise RuntimeError("boom")
+
+        self.assertEqual(self.state_path.read_bytes(), before)
+        # The batch is fully unwound: saves write immediately again
+        mgr.save_state()
+        self.assertIn(b"half-applied", self.state_path.read_bytes())
+
+    def test_lookups_follow_in_place_list_edits(self):
+        """Test that id lookups stay correct after equal-length edits to the lists."""
+        mgr = StateManager(self.state_path)
+        a = InboxItem(id="a", text="a", createdAt="t")
+        b = InboxItem(id="b", text="b", createdAt="t")
+        mgr.state = State(inbox=[a])
+        self.assertIs(mgr.get_inbox_item("a"), a)
+
+        mgr.state.inbox.remove(a)
+        mgr.state.inbox.append(b)
+        self.assertIs(mgr.get_inbox_item("b"), b)
+        self.assertIsNone(mgr.get_inbox_item("a"))
+
+        b.id = "renamed"
+        self.assertIsNone(mgr.get_inbox_item("b"))
+        self.assertIs(mgr.get_inbox_item("renamed"), b)
+
+        first = Run(id="dup", projectId="p", runName="first", state="running")
+        second = Run(id="dup", projectId="p", runName="second", state="running")
+        mgr.state.runs = [first, second]
+        self.assertIs(mgr.get_run("dup"), first)
+
+    def test_complex_state_serializes_correctly(self):
+        """Test that every kind of item survives a save and a fresh load."""
+        state = _complex_state()
+        StateManager(self.state_path, durable=False).update_state(state)
+
+        loaded = StateManager(self.state_path).load_state().to_dict()
+
+        expected = state.to_dict()
+        for kind in expected:
+            with self.subTest(kind=kind):
+                self.assertEqual(loaded[kind], expected[kind])
+
+    def test_loose_files_load_with_either_backend(self):
+        """Test that null ids, loose types and unknown keys load with either JSON backend."""
+        data = _complex_state().to_dict()
+        data["legacyKey"] = 1
+        data["projects"][0]["id"] = None
+        data["projects"][0]["status"] = 1
+        data["runs"][0]["removedField"] = "x"
+        self.state_path.write_text(json.dumps(data))
+
+        for use_orjson in (state.ORJSON_AVAILABLE, False):
+            with self.subTest(orjson=use_orjson), \
+                    patch.object(state, "ORJSON_AVAILABLE", use_orjson):
+                loaded = StateManager(self.state_path).load_state()
+
+                project = loaded.projects[0]
+                self.assertTrue(project.id)
+                self.assertEqual(project.status, 1)
+                self.assertEqual(loaded.runs, _complex_state().runs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,55 +10,99 @@ to be available via npx. They are primarily for manual verification
 and CI environments with browser support.
 """
 
+import functools
+import os
+import shutil
+import time
 import unittest
 import subprocess
 import json
-import sys
+from pathlib import Path
+
+# In the user's own cache dir, not the shared system tmpdir, so other local
+# users can neither plant a symlink there nor pre-seed a version
+_NPM_VERSION_CACHE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "claude-harness" / "chrome_devtools_mcp.ver"
+)
+_NPM_VERSION_TTL = 24 * 60 * 60  # seconds
+
+_CLIENT_PY = Path(__file__).parent.parent / "client.py"
+
+_ESSENTIAL_BROWSER_TOOLS = frozenset({
+    "mcp__chrome-devtools__navigate_page",
+    "mcp__chrome-devtools__take_screenshot",
+    "mcp__chrome-devtools__click",
+    "mcp__chrome-devtools__fill",
+})
 
 
 class TestUICapabilities(unittest.TestCase):
     """Test browser automation capabilities."""
 
-    def test_chrome_devtools_mcp_available(self):
-        """Verify chrome-devtools-mcp package is accessible via npx."""
-        # Check if npx can find the package (doesn't actually run it)
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _npm_version(cls) -> str:
+        """Published chrome-devtools-mcp version, cached for a day on disk.
+
+        Returns:
+            Version string, or "" if npm could not find the package
+
+        Raises:
+            subprocess.TimeoutExpired: If npm does not answer (e.g. offline)
+        """
+        try:
+            if time.time() - _NPM_VERSION_CACHE.stat().st_mtime < _NPM_VERSION_TTL:
+                return _NPM_VERSION_CACHE.read_text().strip()
+        except OSError:
+            pass
+
+        # Check if npm can find the package (doesn't actually run it)
         result = subprocess.run(
             ["npm", "show", "chrome-devtools-mcp", "version"],
             capture_output=True,
             text=True,
             timeout=30,
         )
-        self.assertEqual(result.returncode, 0, "chrome-devtools-mcp package not found on npm")
-        self.assertTrue(len(result.stdout.strip()) > 0, "No version returned")
+        version = result.stdout.strip() if result.returncode == 0 else ""
+        if version:
+            # Only successful lookups are cached; failures retry next run
+            try:
+                _NPM_VERSION_CACHE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+                _NPM_VERSION_CACHE.write_text(version)
+            except OSError:
+                pass
+        return version
+
+    @unittest.skipUnless(shutil.which("npm"), "npm not installed")
+    def test_chrome_devtools_mcp_available(self):
+        """Verify chrome-devtools-mcp package is accessible via npx."""
+        try:
+            version = self._npm_version()
+        except subprocess.TimeoutExpired:
+            self.skipTest("npm registry did not answer (offline?)")
+        self.assertTrue(version, "chrome-devtools-mcp package not found on npm")
 
     def test_browser_tools_defined_in_client(self):
         """Verify BROWSER_TOOLS list is properly defined in client.py."""
         # Import the module to check the tools list
-        sys.path.insert(0, ".")
         from client import BROWSER_TOOLS
 
-        # Check essential tools are present
-        essential_tools = [
-            "mcp__chrome-devtools__navigate_page",
-            "mcp__chrome-devtools__take_screenshot",
-            "mcp__chrome-devtools__click",
-            "mcp__chrome-devtools__fill",
-        ]
-        
-        for tool in essential_tools:
-            self.assertIn(tool, BROWSER_TOOLS, f"Missing essential tool: {tool}")
+        # Check essential tools are present; report every missing one at once
+        missing = _ESSENTIAL_BROWSER_TOOLS.difference(BROWSER_TOOLS)
+        self.assertFalse(missing, f"Missing essential tools: {sorted(missing)}")
 
     def test_mcp_server_config_in_client(self):
         """Verify MCP server is configured correctly in client.py."""
-        with open("client.py", "r") as f:
-            content = f.read()
+        # Raw bytes, no decode; resolved from the repo root, not the cwd
+        content = _CLIENT_PY.read_bytes()
         
         # Check that chrome-devtools-mcp is configured
-        self.assertIn("chrome-devtools-mcp", content, "chrome-devtools-mcp not configured")
-        self.assertIn("chrome-devtools", content, "chrome-devtools server not defined")
+        self.assertIn(b"chrome-devtools-mcp", content, "chrome-devtools-mcp not configured")
+        self.assertIn(b"chrome-devtools", content, "chrome-devtools server not defined")
         
         # Ensure old puppeteer-mcp-server is not present
-        self.assertNotIn("puppeteer-mcp-server", content, "Old puppeteer-mcp-server still configured")
+        self.assertNotIn(b"puppeteer-mcp-server", content, "Old puppeteer-mcp-server still configured")
 
 
 if __name__ == "__main__":